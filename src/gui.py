@@ -1,18 +1,29 @@
-import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import threading
+import queue
 import struct
 import time
 import tkinter.font as tkfont
-import xml.etree.ElementTree as ET
+try:
+    # lxml parses the config XML faster; the findall/findtext API used here is compatible
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 import serial.tools.list_ports
-from functools import partial
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 import json
+try:
+    # orjson encodes/decodes the settings file faster; output stays 2-space indented JSON
+    import orjson
+except ImportError:
+    orjson = None
 import os
 import datetime
+import random
 from tkinter.scrolledtext import ScrolledText
 
-from transport import SerialTransport, compute_crc
+from transport import SerialTransport, compute_crc, read_request, unpack_registers
 
 # GUI-related constants
 # Parameter address used to enable/disable the drive
@@ -22,83 +33,273 @@ EEPROM_SAVE_ADDR = 0x1001
 EEPROM_SAVE_VALUE = 0x1234
 # Wait (seconds) after sending EEPROM save command; recommended >5s
 EEPROM_WAIT_SECONDS = 5.5
+# Maximum registers fetched per request by Read All (Modbus allows up to 125)
+READ_ALL_MAX_REGS = 64
+# Read Favorites reads across gaps of up to this many unwanted registers
+# rather than sending a separate request
+FAV_READ_MAX_GAP = 4
+# After this many favorites sweeps in a row without an answer from a drive, sweeps
+# skip it and only try it again every DRIVE_RETRY_SECONDS
+DRIVE_FAIL_LIMIT = 3
+DRIVE_RETRY_SECONDS = 10.0
+# How long (seconds) an enumerated COM port list is reused before asking the OS again
+PORTS_CACHE_SECONDS = 2.0
+# Settings changes made within this many milliseconds are written to disk together
+CONFIG_SAVE_DELAY_MS = 200
+# Choices offered by the connection comboboxes
+BAUD_RATES = (9600, 19200, 38400, 57600, 115200)
+PARITIES = ('N', 'E', 'O')
+
+# Modbus request frame: Addr(1) FC(1) REG_H REG_L VAL_H VAL_L, followed by CRC_L CRC_H
+_REQ_STRUCT = struct.Struct('>BBHH')
+_CRC_STRUCT = struct.Struct('<H')
+# (drive_id, func) -> CRC state after those two bytes
+_CRC_PREFIX = {}
+
+
+def _build_request(drive_id, func, addr, value):
+    """Return the complete 8-byte request frame (including CRC) for a 0x03/0x04/0x06 call."""
+    req = bytearray(8)
+    _REQ_STRUCT.pack_into(req, 0, drive_id, func, addr, value)
+    # every frame to the same drive/function starts with the same two bytes,
+    # so resume the CRC from their cached state and only run it over addr/value
+    state = _CRC_PREFIX.get((drive_id, func))
+    if state is None:
+        state = _CRC_PREFIX[(drive_id, func)] = compute_crc(bytes((drive_id, func)))
+    _CRC_STRUCT.pack_into(req, 6, compute_crc(memoryview(req)[2:6], state))
+    return req
+
+
+def _dump_config(config) -> bytes:
+    """Serialize the settings dict to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
+
+def _load_config(raw: bytes) -> dict:
+    """Parse settings JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _status_runs(ids, max_count=8, max_gap=0):
+    """Split register addresses into (start, count) runs of at most `max_count` registers.
+
+    Ids up to `max_gap` addresses apart share a run; the registers in between are
+    read along with them.
+    """
+    ids = sorted(ids)
+    runs = []
+    i = 0
+    n = len(ids)
+    while i < n:
+        start = ids[i]
+        count = 1
+        j = i + 1
+        while j < n and ids[j] - (start + count) <= max_gap and ids[j] - start < max_count:
+            count = ids[j] - start + 1
+            j += 1
+        runs.append((start, count))
+        i = j
+    return runs
+
+
+@lru_cache(maxsize=4096)
+def _parse_fav(fav):
+    """Split a favorite key into ('p', pid) or ('s', func, addr); None if malformed.
+
+    'p:<id>' and legacy bare ids give the parameter id as a string, 's:<func>:<addr>'
+    gives function and address as ints.
+    """
+    fav = str(fav)
+    if fav.startswith('s:'):
+        parts = fav.split(':')
+        if len(parts) < 3:
+            return None
+        try:
+            return ('s', int(parts[1]), int(parts[2]))
+        except ValueError:
+            return None
+    return ('p', fav[2:] if fav.startswith('p:') else fav)
 
 
-def load_parameters(xml_path):
-    # simple on-disk cache to avoid reparsing XML repeatedly
+def _tree_font(widget):
+    """Return the font ttk.Treeview rows are drawn with, or None if it cannot be resolved.
+
+    ttk widgets have no -font option, so the font comes from the style (TkDefaultFont if unset).
+    """
     try:
-        global _PARAM_CACHE
-    except NameError:
-        _PARAM_CACHE = {}
-    if xml_path in globals().get('_PARAM_CACHE', {}):
-        return globals()['_PARAM_CACHE'][xml_path]
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+        return tkfont.nametofont(ttk.Style(widget).lookup('Treeview', 'font') or 'TkDefaultFont')
+    except Exception:
+        return None
+
+
+def _iter_tables(source, tag):
+    """Yield each complete `tag` element of `source`, a path/file or an already parsed Element(Tree).
+
+    Paths are stream-parsed and rows already yielded are cleared from the root, so
+    the whole document is never held in memory at once. Read what you need before
+    the next iteration.
+    """
+    if hasattr(source, 'iter'):
+        # parsed by the caller: walk it as is, without re-reading the file
+        yield from source.iter(tag)
+        return
+    root = None
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if root is None:
+            root = elem
+        elif event == 'end' and elem.tag == tag:
+            yield elem
+            root.clear()
+
+
+# (kind, absolute path, mtime_ns) -> rows parsed from that file
+_XML_CACHE = {}
+
+
+def _xml_cache_key(kind, source):
+    """Cache key for a file path `source`; None for parsed trees, file objects and missing files."""
+    if not isinstance(source, (str, os.PathLike)):
+        return None
+    try:
+        return (kind, os.path.abspath(source), os.stat(source).st_mtime_ns)
+    except OSError:
+        return None
+
+
+class Param:
+    """One parameter definition from the XML.
+
+    Slots instead of a dict per row; get() and [] keep the dict-style access used
+    throughout the favorites code working.
+    """
+    __slots__ = ('id', 'name', 'description', 'value', 'min', 'max', 'default', 'type', 'access')
+
+    def __init__(self, id, name, description, value, min, max, default, type, access):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.value = value
+        self.min = min
+        self.max = max
+        self.default = default
+        self.type = type
+        self.access = access
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+def load_parameters(xml_path):
+    """Return the Param rows from `xml_path` (a path, or an already parsed Element)."""
+    # parse each file once; a changed file (new mtime) is parsed again
+    key = _xml_cache_key('params', xml_path)
+    if key in _XML_CACHE:
+        return _XML_CACHE[key]
     params = []
-    for node in root.findall('ServoParameterTable'):
+    for node in _iter_tables(xml_path, 'ServoParameterTable'):
         try:
             pid = int(node.find('id').text)
         except Exception:
             continue
-        params.append({
-            'id': pid,
-            'name': node.findtext('name',''),
-            'description': node.findtext('description',''),
-            'value': node.findtext('value','0'),
-            'min': node.findtext('valueMin',''),
-            'max': node.findtext('valueMax',''),
-            'default': node.findtext('defaultValue',''),
-            'type': node.findtext('type',''),
-            'access': node.findtext('accessType',''),
-        })
-    # store in cache
-    try:
-        _PARAM_CACHE[xml_path] = params
-    except Exception:
-        pass
+        params.append(Param(
+            pid,
+            node.findtext('name',''),
+            node.findtext('description',''),
+            node.findtext('value','0'),
+            node.findtext('valueMin',''),
+            node.findtext('valueMax',''),
+            node.findtext('defaultValue',''),
+            node.findtext('type',''),
+            node.findtext('accessType',''),
+        ))
+    if key is not None:
+        _XML_CACHE[key] = params
     return params
 
 
-def load_status(xml_path):
-    """Parse `config/status.xml` and return a list of status dicts.
+def split_param_pages(params):
+    """Split parameters into the four pages (0xx, 1xx, 2xx, everything else) in one pass."""
+    pages = ([], [], [], [])
+    for p in params:
+        b = p.id // 100
+        pages[b if 0 <= b < 3 else 3].append(p)
+    return pages
+
 
-    Each dict contains: id (int), name, description, value, type, units.
+def load_status(xml_path, func: str = '04'):
+    """Parse `config/status.xml` (or an already parsed Element) and return a list of status dicts.
+
+    Each dict contains: id (int), name, description, value, type, units, plus the
+    display string addr_text ('0x0010') and iid, the row id in the status tree of
+    function `func` ('04' or '03'), e.g. 's:04:16'.
     """
+    key = _xml_cache_key(f'status{func}', xml_path)
+    if key in _XML_CACHE:
+        return _XML_CACHE[key]
+    stats = []
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        for node in _iter_tables(xml_path, 'ServoStatusTable'):
+            try:
+                sid = int(node.findtext('id','0'))
+            except Exception:
+                continue
+            stats.append({
+                'id': sid,
+                'name': node.findtext('name',''),
+                'description': node.findtext('description',''),
+                'value': node.findtext('value','0'),
+                'type': node.findtext('type',''),
+                'units': node.findtext('units',''),
+                'addr_text': f'0x{sid:04x}',
+                'iid': f's:{func}:{sid}',
+            })
     except Exception:
         return []
-    stats = []
-    for node in root.findall('ServoStatusTable'):
-        try:
-            sid = int(node.findtext('id','0'))
-        except Exception:
-            continue
-        stats.append({
-            'id': sid,
-            'name': node.findtext('name',''),
-            'description': node.findtext('description',''),
-            'value': node.findtext('value','0'),
-            'type': node.findtext('type',''),
-            'units': node.findtext('units',''),
-        })
     # sort by id
     stats.sort(key=lambda x: x['id'])
+    if key is not None:
+        _XML_CACHE[key] = stats
     return stats
 
 
 class DriveTab:
-    def __init__(self, parent, drive_id, transport: SerialTransport, params, tk_parent, app, close_callback=None, status_entries_04=None, status_entries_03=None, desc_width_chars: int = 40):
+    def __init__(self, parent, drive_id, transport: SerialTransport, params, tk_parent, app, close_callback=None, status_entries_04=None, status_entries_03=None, desc_width_chars: int = 40, param_pages=None, status_plan=None):
         self.drive_id = drive_id
         self.transport = transport
         self.params = params
+        # params grouped per page; App splits them once for all drive tabs
+        self.param_pages = param_pages if param_pages is not None else split_param_pages(params)
         self.status_entries_04 = status_entries_04 or []
         self.status_entries_03 = status_entries_03 or []
+        # id lookups for the favorites views: str param id -> Param, int status id -> entry
+        self._params_by_id = {str(p.id): p for p in self.params}
+        self._status_04_by_id = {s['id']: s for s in self.status_entries_04}
+        self._status_03_by_id = {s['id']: s for s in self.status_entries_03}
+        # func -> [(start, count), ...]; the status tables are fixed, so App plans the
+        # reads once for all drive tabs (planned on first refresh when not given)
+        self._status_runs = dict(status_plan) if status_plan else {}
+        # status tree -> longest value text the Value column was sized for
+        self._status_value_chars = {}
+        # [(addr, param), ...] planned by the first read_all
+        self._read_all_targets = None
         self.desc_width_chars = desc_width_chars
         self.frame = ttk.Frame(parent)
         self.tk_parent = tk_parent
         self.app = app
+        # this drive's favorite keys ('p:<id>', 's:<func>:<addr>'), kept in step with app.config
+        self._fav_set = set(app.config.get('favorites', {}).get(str(drive_id), []))
+        # favorites the local favorites tree was last built from; values are kept
+        # current row by row, so the tree is only rebuilt when this list changes
+        self._fav_tree_keys = None
         self.enabled = False
         self._close_cb = close_callback
         # Diagnostic: print how many parameters were passed to this drive tab
@@ -129,178 +330,63 @@ class DriveTab:
         param_notebook = ttk.Notebook(container)
         param_notebook.pack(fill='both', expand=True, padx=4, pady=4)
 
-        # Helper to create a scrollable frame for each parameter group
+        # param id (str) -> Treeview holding its row; the row iid is the same str id
+        self.param_widgets = {}
+        self._param_btns = []
+        self._params_enabled = True
+
+        # Helper to create one parameter Treeview per group
         def make_param_page(title):
             page = ttk.Frame(param_notebook)
-            canvas = tk.Canvas(page)
-            canvas.pack(side='left', fill='both', expand=True)
-            vsb = ttk.Scrollbar(page, orient='vertical', command=canvas.yview)
-            vsb.pack(side='right', fill='y')
-            canvas.configure(yscrollcommand=vsb.set)
-            inner = ttk.Frame(canvas)
-            canvas.create_window((0, 0), window=inner, anchor='nw')
-            inner.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
             param_notebook.add(page, text=title)
-            # Mouse wheel support: bind while cursor is over this canvas
-            def _on_mousewheel(event):
-                # Normalize for platform
-                if getattr(event, 'num', None) == 4:
-                    delta = -1
-                elif getattr(event, 'num', None) == 5:
-                    delta = 1
-                else:
-                    try:
-                        delta = int(-1 * (event.delta / 120))
-                    except Exception:
-                        delta = 0
-                # scroll fewer units for smoother motion
-                canvas.yview_scroll(delta * 3, 'units')
-
-            def _on_enter(e):
-                # bind mouse wheel globally while over this canvas
-                canvas.bind_all('<MouseWheel>', _on_mousewheel)
-                canvas.bind_all('<Button-4>', _on_mousewheel)
-                canvas.bind_all('<Button-5>', _on_mousewheel)
-
-            def _on_leave(e):
-                try:
-                    canvas.unbind_all('<MouseWheel>')
-                except Exception:
-                    pass
-                try:
-                    canvas.unbind_all('<Button-4>')
-                    canvas.unbind_all('<Button-5>')
-                except Exception:
-                    pass
-
-            canvas.bind('<Enter>', _on_enter)
-            canvas.bind('<Leave>', _on_leave)
-
-            return inner
+            ops = ttk.Frame(page)
+            ops.pack(fill='x', padx=4, pady=(4,0))
+            cols = ('star', 'name', 'desc', 'min', 'value', 'max')
+            tree = ttk.Treeview(page, columns=cols, show='headings', height=15)
+            vsb = ttk.Scrollbar(page, orient='vertical', command=tree.yview)
+            tree.configure(yscrollcommand=vsb.set)
+            vsb.pack(side='right', fill='y')
+            tree.pack(side='left', fill='both', expand=True, padx=4, pady=4)
+            tree.heading('star', text='')
+            tree.column('star', width=28, anchor='center', stretch=False)
+            for c, h in (('name','Name'), ('desc','Description'), ('min','Min'), ('value','Value'), ('max','Max')):
+                tree.heading(c, text=h)
+            char_w = self.app.measure('0')
+            tree.column('name', width=char_w * 16)
+            tree.column('desc', width=char_w * self.desc_width_chars)
+            tree.column('min', width=char_w * 8, anchor='e')
+            tree.column('value', width=char_w * 10, anchor='e')
+            tree.column('max', width=char_w * 8, anchor='e')
+            read_btn = ttk.Button(ops, text='Read Selected', command=lambda: self.read_selected_params(tree))
+            read_btn.pack(side='left')
+            write_btn = ttk.Button(ops, text='Write Selected', command=lambda: self.write_selected_params(tree))
+            write_btn.pack(side='left', padx=6)
+            ttk.Label(ops, text='Double-click a value to edit it').pack(side='left', padx=6)
+            self._param_btns.extend((read_btn, write_btn))
+            # single-click star column to toggle favorite, double-click value to edit
+            tree.bind('<Button-1>', lambda e: self._on_param_tree_click(e, tree))
+            tree.bind('<Double-1>', lambda e: self._edit_param_cell(e, tree))
+            return tree
 
         page0 = make_param_page('Params 0xx')
         page1 = make_param_page('Params 1xx')
         page2 = make_param_page('Params 2xx')
         page3 = make_param_page('Params 3xx')
 
-        self.param_widgets = {}
+        favs = self._fav_set
 
-        # column headers for each page
-        def add_headers(parent):
-            header = ttk.Frame(parent)
-            header.pack(fill='x', padx=4, pady=(2,6))
-            ttk.Label(header, text='', width=2).grid(row=0, column=0)
-            ttk.Label(header, text='Name', width=14).grid(row=0, column=1, sticky='w')
-            ttk.Label(header, text='Description', width=self.desc_width_chars).grid(row=0, column=2, sticky='w')
-            ttk.Label(header, text='Min', width=8).grid(row=0, column=3)
-            ttk.Label(header, text='Value', width=10).grid(row=0, column=4)
-            ttk.Label(header, text='Max', width=8).grid(row=0, column=5)
-            ttk.Label(header, text='').grid(row=0, column=6)
-
-        add_headers(page0)
-        add_headers(page1)
-        add_headers(page2)
-        add_headers(page3)
-
-        # Distribute parameters into page lists based on id ranges
-        params_page0 = []
-        params_page1 = []
-        params_page2 = []
-        params_page3 = []
-        for p in self.params:
-            try:
-                pid = int(p.get('id', 0))
-            except Exception:
-                pid = 0
-            if 0 <= pid <= 99:
-                params_page0.append(p)
-            elif 100 <= pid <= 199:
-                params_page1.append(p)
-            elif 200 <= pid <= 299:
-                params_page2.append(p)
-            else:
-                params_page3.append(p)
-
-        # Populate rows in small batches to keep UI responsive
-        def populate_page(parent, params_list, drive_tab=None):
-            batch = 30
-            def add_batch(start=0):
-                end = min(start + batch, len(params_list))
-                for idx in range(start, end):
-                    p = params_list[idx]
-                    row = ttk.Frame(parent)
-                    row.pack(fill='x', padx=4, pady=2)
-                    # star button for favorites
-                    pid_str = str(p.get('id',''))
-                    is_fav = False
-                    try:
-                        fav_list = self.app.config.get('favorites', {}).get(str(self.drive_id), [])
-                        is_fav = ('p:' + pid_str) in fav_list
-                    except Exception:
-                        is_fav = False
-                    star_txt = '★' if is_fav else '☆'
-                    star_btn = ttk.Button(row, text=star_txt, width=2)
-                    star_btn.grid(row=0, column=0)
-
-                    name_lbl = ttk.Label(row, text=f"{p.get('name','')} ({p.get('id','')})", width=14, anchor='w', font=('Segoe UI', 9, 'bold'))
-                    name_lbl.grid(row=0, column=1, sticky='w')
-                    desc_lbl = ttk.Label(row, text=p.get('description',''), width=self.desc_width_chars, anchor='w')
-                    desc_lbl.grid(row=0, column=2, sticky='w', padx=(6,0))
-                    min_lbl = ttk.Label(row, text=str(p.get('min','')), width=8)
-                    min_lbl.grid(row=0, column=3)
-                    entry = ttk.Entry(row, width=10)
-                    entry.insert(0, str(p.get('value','')))
-                    entry.grid(row=0, column=4, padx=6)
-                    max_lbl = ttk.Label(row, text=str(p.get('max','')), width=8)
-                    max_lbl.grid(row=0, column=5)
-                    read_btn = ttk.Button(row, text='Read', command=partial(self.read_param, p, entry))
-                    read_btn.grid(row=0, column=6, padx=2)
-                    write_btn = ttk.Button(row, text='Write', command=partial(self.write_param, p, entry, entry))
-                    write_btn.grid(row=0, column=7, padx=2)
-                    # store widgets keyed by string id for consistency
-                    self.param_widgets[str(p['id'])] = {
-                        'entry': entry,
-                        'read': read_btn,
-                        'write': write_btn,
-                        'star': star_btn,
-                    }
-
-                    # local toggle handler
-                    def _toggle_local(pid=pid_str, btn=star_btn):
-                        new_state = self.app.toggle_favorite(self.drive_id, 'p:' + pid)
-                        try:
-                            btn.config(text='★' if new_state else '☆')
-                        except Exception:
-                            pass
-                        # refresh local and global favorite views
-                        try:
-                            self.refresh_local_favorites()
-                        except Exception:
-                            pass
-                        try:
-                            self.app.refresh_global_favorites()
-                        except Exception:
-                            pass
-
-                    star_btn.config(command=_toggle_local)
-                if end < len(params_list):
-                    # schedule next batch, small delay to keep UI responsive
-                    parent.after(20, add_batch, end)
-            # start populating
-            parent.after(10, add_batch, 0)
-
-        populate_page(page0, params_page0)
-        populate_page(page1, params_page1)
-        populate_page(page2, params_page2)
-        populate_page(page3, params_page3)
-
-        # After parameter rows are populated in batches, refresh the local
-        # favorites view so it can show live values. Delay allows the
-        # batches to create widgets first.
-        try:
-            self.tk_parent.after(500, self.refresh_local_favorites)
-        except Exception:
-            pass
+        def populate_page(tree, params_list):
+            # hide the data columns while bulk inserting so Tk does not lay out each row
+            tree.configure(displaycolumns=())
+            for p in params_list:
+                iid = str(p.id)
+                star = '★' if ('p:' + iid) in favs else '☆'
+                tree.insert('', 'end', iid=iid, values=(star, f"{p.name} ({iid})", p.description, p.min, p.value, p.max))
+                self.param_widgets[iid] = tree
+            tree.configure(displaycolumns='#all')
+
+        for tree, params_list in zip((page0, page1, page2, page3), self.param_pages):
+            populate_page(tree, params_list)
 
         # Status tab as separate tabs: Status 04 and Status 03
         status_page = ttk.Frame(param_notebook.master)
@@ -311,6 +397,23 @@ class DriveTab:
         # Favorites tab (local to this drive)
         fav_page = ttk.Frame(param_notebook.master)
         param_notebook.add(fav_page, text='Favorites')
+
+        # the status and favorites pages are only filled the first time they are shown
+        lazy_pages = {
+            str(status_page): partial(self._build_status_tab, status_page, '04'),
+            str(status_page_03): partial(self._build_status_tab, status_page_03, '03'),
+            str(fav_page): partial(self._build_local_favorites, fav_page),
+        }
+
+        def on_tab_changed(event):
+            build = lazy_pages.pop(param_notebook.select(), None)
+            if build is not None:
+                build()
+
+        param_notebook.bind('<<NotebookTabChanged>>', on_tab_changed)
+
+    def _build_local_favorites(self, fav_page):
+        # Favorites tab (local to this drive)
         self.fav_tree = ttk.Treeview(fav_page, columns=('addr','desc','min','max','value','units'), show='headings', height=10)
         self.fav_tree.pack(fill='both', expand=True, padx=4, pady=4)
         for c,h in (('addr','Addr'),('desc','Description'),('min','Min'),('max','Max'),('value','Value'),('units','Units')):
@@ -321,7 +424,6 @@ class DriveTab:
                 self.fav_tree.column(c, width=80, anchor='e')
             else:
                 self.fav_tree.column(c, width=120)
-        # initial populate will be done after rows are created
         # add Read/Write buttons for this drive's favorites
         try:
             fav_ops = ttk.Frame(fav_page)
@@ -341,173 +443,82 @@ class DriveTab:
                 pass
         except Exception:
             pass
-        # initial populate will be done after rows are created
-
-        # --- Status 04 UI ---
-        s_top = ttk.Frame(status_page)
-        s_top.pack(fill='x')
-        self.status_refresh_btn_04 = ttk.Button(s_top, text='Refresh Status 04', command=self.refresh_status_04)
-        self.status_refresh_btn_04.pack(side='left')
+        self.refresh_local_favorites()
+
+    def _build_status_tab(self, page, func):
+        """Fill the Status `func` page ('04' or '03'); sets self.status_tree_<func> and returns it."""
+        top = ttk.Frame(page)
+        top.pack(fill='x')
+        refresh_btn = ttk.Button(top, text=f'Refresh Status {func}', command=getattr(self, f'refresh_status_{func}'))
+        refresh_btn.pack(side='left')
+        setattr(self, f'status_refresh_btn_{func}', refresh_btn)
         # Columns: star | addr(hex) | Description | Value | Units
-        cols = ('star','addr', 'desc', 'value', 'units')
-        self.status_tree_04 = ttk.Treeview(status_page, columns=cols, show='headings', height=10)
-        self.status_tree_04.pack(fill='both', expand=True, padx=4, pady=4)
-        self.status_tree_04.heading('star', text='')
-        self.status_tree_04.column('star', width=28, anchor='center', stretch=False)
-        self.status_tree_04.heading('addr', text='Addr')
-        self.status_tree_04.heading('desc', text='Description')
-        self.status_tree_04.heading('value', text='Value')
-        self.status_tree_04.heading('units', text='Units')
-        self.status_tree_04.column('addr', width=80, anchor='center')
-        self.status_tree_04.column('desc', width=360)
-        self.status_tree_04.column('value', width=120, anchor='e')
-        self.status_tree_04.column('units', width=80)
+        cols = ('star', 'addr', 'desc', 'value', 'units')
+        tree = ttk.Treeview(page, columns=cols, show='headings', height=10)
+        setattr(self, f'status_tree_{func}', tree)
+        tree.heading('star', text='')
+        tree.column('star', width=28, anchor='center', stretch=False)
+        tree.heading('addr', text='Addr')
+        tree.heading('desc', text='Description')
+        tree.heading('value', text='Value')
+        tree.heading('units', text='Units')
+        tree.column('addr', width=80, anchor='center')
+        tree.column('desc', width=360)
+        tree.column('value', width=120, anchor='e')
+        tree.column('units', width=80)
         # configure tags for coloring favorite rows
         try:
-            self.status_tree_04.tag_configure('fav', foreground='orange')
-            self.status_tree_04.tag_configure('nofav', foreground='black')
+            tree.tag_configure('fav', foreground='orange')
+            tree.tag_configure('nofav', foreground='black')
         except Exception:
             pass
-        for s in self.status_entries_04:
-            sid = int(s.get('id', 0))
-            addr_text = format(sid, '#06x')
-            desc = s.get('description','')
-            val = s.get('value','')
-            units = s.get('units','')
-            iid = f's:04:{sid}'
-            isfav = (f's:04:{sid}') in self.app.config.get('favorites', {}).get(str(self.drive_id), [])
-            star = '★' if isfav else '☆'
-            tag = 'fav' if isfav else 'nofav'
-            self.status_tree_04.insert('', 'end', iid=iid, values=(star, addr_text, desc, val, units), tags=(tag,))
+        measure = self.app.measure
+        measured = ('addr', 'desc', 'value', 'units')
+        max_w = {col: measure(tree.heading(col)['text']) for col in measured}
+        longest = dict.fromkeys(measured, '')
+        favs = self._fav_set
+        # hide the data columns while bulk inserting so Tk does not lay out each row
+        tree.configure(displaycolumns=())
+        for s in getattr(self, f'status_entries_{func}'):
+            iid = s['iid']
+            isfav = iid in favs
+            values = ('★' if isfav else '☆', s['addr_text'], s['description'], s['value'], s['units'])
+            tree.insert('', 'end', iid=iid, values=values, tags=('fav' if isfav else 'nofav',))
+            # remember the longest text per column; measuring every cell is one Tcl call each
+            for col, txt in zip(cols, values):
+                if col in longest and len(txt) > len(longest[col]):
+                    longest[col] = txt
         # autosize columns to fit content
-        try:
-            f = tkfont.nametofont(self.status_tree_04.cget('font'))
-        except Exception:
-            f = None
-        if f is not None:
-            for col in ('addr', 'desc', 'value', 'units'):
-                # measure header
-                hdr_w = f.measure(self.status_tree_04.heading(col)['text'])
-                max_w = hdr_w
-                for iid in self.status_tree_04.get_children():
-                    txt = str(self.status_tree_04.set(iid, col))
-                    w = f.measure(txt)
-                    if w > max_w:
-                        max_w = w
-                self.status_tree_04.column(col, width=max_w + 8)
+        for col in measured:
+            tree.column(col, width=max(max_w[col], measure(longest[col])) + 8)
+        tree.configure(displaycolumns='#all')
+        # pack only once filled, so the rows never trigger a geometry pass of the page
+        tree.pack(fill='both', expand=True, padx=4, pady=4)
+
         # make units consume remaining space; keep other columns minimal
-        def autosize_04(event=None):
+        def autosize(event=None):
             try:
-                total = self.status_tree_04.winfo_width()
+                total = tree.winfo_width()
                 if total <= 20:
                     return
-                cols = ('addr', 'desc', 'value', 'units')
                 used = 0
-                padding = 8 * len(cols)
-                for c in cols[:-1]:
-                    used += int(self.status_tree_04.column(c)['width'])
+                padding = 8 * len(measured)
+                for c in measured[:-1]:
+                    used += int(tree.column(c)['width'])
                 rem = total - used - padding
                 if rem < 60:
                     rem = 60
-                self.status_tree_04.column('units', width=rem)
+                tree.column('units', width=rem)
             except Exception:
                 pass
 
-        self.status_tree_04.bind('<Configure>', autosize_04)
+        tree.bind('<Configure>', autosize)
         try:
             # single-click star column to toggle favorite
-            self.status_tree_04.bind('<Button-1>', lambda e: self._on_status_tree_click(e, '04', self.status_tree_04))
-            # mouse wheel while over tree
-            def _enter04(e):
-                self.status_tree_04.bind_all('<MouseWheel>', lambda ev: self.status_tree_04.yview_scroll(int(-1*(ev.delta/120)), 'units'))
-            def _leave04(e):
-                try:
-                    self.status_tree_04.unbind_all('<MouseWheel>')
-                except Exception:
-                    pass
-            self.status_tree_04.bind('<Enter>', _enter04)
-            self.status_tree_04.bind('<Leave>', _leave04)
-        except Exception:
-            pass
-
-        # --- Status 03 UI ---
-        s_top3 = ttk.Frame(status_page_03)
-        s_top3.pack(fill='x')
-        self.status_refresh_btn_03 = ttk.Button(s_top3, text='Refresh Status 03', command=self.refresh_status_03)
-        self.status_refresh_btn_03.pack(side='left')
-        # Columns: addr(hex) | Description | Value | Units for 0x03 space
-        cols3 = ('addr', 'desc', 'value', 'units')
-        self.status_tree_03 = ttk.Treeview(status_page_03, columns=cols3, show='headings', height=10)
-        self.status_tree_03.pack(fill='both', expand=True, padx=4, pady=4)
-        self.status_tree_03.heading('addr', text='Addr')
-        self.status_tree_03.heading('desc', text='Description')
-        self.status_tree_03.heading('value', text='Value')
-        self.status_tree_03.heading('units', text='Units')
-        self.status_tree_03.column('addr', width=100, anchor='center')
-        self.status_tree_03.column('desc', width=360)
-        self.status_tree_03.column('value', width=120, anchor='e')
-        self.status_tree_03.column('units', width=80)
-        try:
-            self.status_tree_03.tag_configure('fav', foreground='orange')
-            self.status_tree_03.tag_configure('nofav', foreground='black')
-        except Exception:
-            pass
-        for s in self.status_entries_03:
-            sid = int(s.get('id', 0))
-            addr_text = format(sid, '#06x')
-            desc = s.get('description','')
-            val = s.get('value','')
-            units = s.get('units','')
-            iid = f's:03:{sid}'
-            isfav = (f's:03:{sid}') in self.app.config.get('favorites', {}).get(str(self.drive_id), [])
-            star = '★' if isfav else '☆'
-            tag = 'fav' if isfav else 'nofav'
-            self.status_tree_03.insert('', 'end', iid=iid, values=(star, addr_text, desc, val, units), tags=(tag,))
-        try:
-            f3 = tkfont.nametofont(self.status_tree_03.cget('font'))
-        except Exception:
-            f3 = None
-        if f3 is not None:
-            for col in ('addr', 'desc', 'value', 'units'):
-                hdr_w = f3.measure(self.status_tree_03.heading(col)['text'])
-                max_w = hdr_w
-                for iid in self.status_tree_03.get_children():
-                    txt = str(self.status_tree_03.set(iid, col))
-                    w = f3.measure(txt)
-                    if w > max_w:
-                        max_w = w
-                self.status_tree_03.column(col, width=max_w + 8)
-        def autosize_03(event=None):
-            try:
-                total = self.status_tree_03.winfo_width()
-                if total <= 20:
-                    return
-                cols = ('addr', 'desc', 'value', 'units')
-                used = 0
-                padding = 8 * len(cols)
-                for c in cols[:-1]:
-                    used += int(self.status_tree_03.column(c)['width'])
-                rem = total - used - padding
-                if rem < 60:
-                    rem = 60
-                self.status_tree_03.column('units', width=rem)
-            except Exception:
-                pass
-
-        self.status_tree_03.bind('<Configure>', autosize_03)
-        try:
-            self.status_tree_03.bind('<Button-1>', lambda e: self._on_status_tree_click(e, '03', self.status_tree_03))
-            def _enter03(e):
-                self.status_tree_03.bind_all('<MouseWheel>', lambda ev: self.status_tree_03.yview_scroll(int(-1*(ev.delta/120)), 'units'))
-            def _leave03(e):
-                try:
-                    self.status_tree_03.unbind_all('<MouseWheel>')
-                except Exception:
-                    pass
-            self.status_tree_03.bind('<Enter>', _enter03)
-            self.status_tree_03.bind('<Leave>', _leave03)
+            tree.bind('<Button-1>', lambda e: self._on_status_tree_click(e, func, tree))
         except Exception:
             pass
+        return tree
 
     def toggle_enable(self):
         # Perform write to parameter address ENABLE_PARAM_ADDR using function 0x06
@@ -516,79 +527,86 @@ class DriveTab:
 
         def worker():
             try:
-                req = struct.pack('>B B H H', self.drive_id, 0x06, target_addr, new_val)
-                crc = compute_crc(req)
-                req += struct.pack('<H', crc)
+                req = _build_request(self.drive_id, 0x06, target_addr, new_val)
                 resp = self.transport.send_and_receive(req)
                 # if success toggle state
                 self.enabled = (new_val == 1)
-                self.tk_parent.after(0, lambda: self.enable_btn.config(text='Disable' if self.enabled else 'Enable'))
+                self.tk_parent.after(0, self._show_enabled)
             except Exception as e:
                 self.tk_parent.after(0, (lambda exc=e: messagebox.showerror('Enable error', str(exc))))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self.app.submit_io(worker)
+
+    def _show_enabled(self):
+        # after() callback; the tab may have been closed since the write was queued
+        if self.enable_btn.winfo_exists():
+            self.enable_btn.config(text='Disable' if self.enabled else 'Enable')
+
+    def destroy(self):
+        """Destroy the tab's widgets and drop the references to them."""
+        # pending after() callbacks may still hold this DriveTab for a moment;
+        # they should not keep the destroyed trees reachable through it
+        self.param_widgets.clear()
+        self._param_btns.clear()
+        for attr in ('status_tree_04', 'status_tree_03', 'fav_tree'):
+            if hasattr(self, attr):
+                delattr(self, attr)
+        self.frame.destroy()
 
     def refresh_local_favorites(self):
         """Populate the local Favorites tree for this drive."""
         try:
             if not hasattr(self, 'fav_tree') or not self.fav_tree:
                 return
+            favs = tuple(self.app.config.get('favorites', {}).get(str(self.drive_id), []))
+            if favs == self._fav_tree_keys:
+                return
+            self._fav_tree_keys = favs
             # clear
             for iid in self.fav_tree.get_children():
                 self.fav_tree.delete(iid)
-            favs = self.app.config.get('favorites', {}).get(str(self.drive_id), [])
             for fav in favs:
                 try:
-                    if isinstance(fav, str) and fav.startswith('p:'):
-                        pid = fav.split(':', 1)[1]
-                        pinfo = next((p for p in self.params if str(p.get('id','')) == str(pid)), None)
+                    parsed = _parse_fav(fav)
+                    if parsed is None:
+                        continue
+                    if parsed[0] == 'p':
+                        pid = parsed[1]
+                        pinfo = self._params_by_id.get(pid)
                         desc = pinfo.get('description','') if pinfo else ''
                         min_val = pinfo.get('min','') if pinfo else ''
                         max_val = pinfo.get('max','') if pinfo else ''
-                        val = ''
                         try:
-                            w = self.param_widgets.get(str(pid))
-                            if w:
-                                if isinstance(w, dict):
-                                    val = w.get('entry').get()
-                                else:
-                                    # legacy tuple
-                                    val = w[0].get()
+                            val = self.get_param_value(pid)
                         except Exception:
                             val = ''
                         addr_text = str(pid)
                         units = pinfo.get('units','') if pinfo else ''
                         self.fav_tree.insert('', 'end', iid=fav, values=(addr_text, desc, min_val, max_val, val, units))
-                    elif isinstance(fav, str) and fav.startswith('s:'):
+                    else:
                         # format: s:<func>:<addr>
-                        parts = fav.split(':')
-                        func = parts[1] if len(parts) > 1 else '04'
-                        addr = parts[2] if len(parts) > 2 else parts[-1]
+                        _, func, sid = parsed
                         desc = ''
                         units = ''
                         val = ''
                         # lookup description from status entries
-                        try:
-                            sid = int(addr)
-                        except Exception:
-                            sid = None
-                        if func == '03':
-                            entry = next((s for s in self.status_entries_03 if int(s.get('id',0)) == sid), None)
+                        if func == 0x03:
+                            entry = self._status_03_by_id.get(sid)
                             tree = getattr(self, 'status_tree_03', None)
                         else:
-                            entry = next((s for s in self.status_entries_04 if int(s.get('id',0)) == sid), None)
+                            entry = self._status_04_by_id.get(sid)
                             tree = getattr(self, 'status_tree_04', None)
                         if entry:
                             desc = entry.get('description','')
                             units = entry.get('units','')
                         # try to read live value from tree if present
                         try:
-                            iid = f's:{func}:{sid}' if sid is not None else None
-                            if tree is not None and iid is not None and tree.exists(iid):
+                            iid = f's:{func:02d}:{sid}'
+                            if tree is not None and tree.exists(iid):
                                 val = tree.set(iid, 'value')
                         except Exception:
                             val = ''
-                        addr_text = f"{func}:{addr}"
+                        addr_text = f"{func:02d}:{sid}"
                         # status entries don't have min/max
                         self.fav_tree.insert('', 'end', iid=fav, values=(addr_text, desc, '', '', val, units))
                 except Exception:
@@ -651,15 +669,11 @@ class DriveTab:
             if not sel:
                 return
             iid = sel[0]
-            fav = iid
-            if isinstance(fav, str) and fav.startswith('p:'):
-                pid = fav.split(':',1)[1]
-            else:
-                # legacy numeric or invalid
-                if isinstance(fav, str) and fav.startswith('s:'):
-                    messagebox.showwarning('Write', 'Cannot write to status favorites')
-                    return
-                pid = str(fav)
+            parsed = _parse_fav(iid)
+            if parsed is None or parsed[0] == 's':
+                messagebox.showwarning('Write', 'Cannot write to status favorites')
+                return
+            pid = parsed[1]
             # ask for value
             v = simpledialog.askstring('Write Parameter', f'Value for parameter {pid}:')
             if v is None:
@@ -669,252 +683,286 @@ class DriveTab:
             except Exception:
                 messagebox.showwarning('Invalid', 'Value must be integer')
                 return
-            # perform write
             addr = int(pid)
-            try:
-                req = struct.pack('>B B H H', self.drive_id, 0x06, addr, val)
-                crc = compute_crc(req)
-                req += struct.pack('<H', crc)
-                self.transport.send_and_receive(req)
+
+            def done():
                 # update UI cell if present
+                fav_tree = getattr(self, 'fav_tree', None)
+                if fav_tree is not None and fav_tree.exists(iid):
+                    fav_tree.set(iid, 'value', str(val))
+                self.app.append_log(f"Drive {self.drive_id} wrote param {pid} = {val}")
+
+            # perform write on the serial worker
+            def worker():
                 try:
-                    if self.fav_tree.exists(fav):
-                        self.fav_tree.set(fav, 'value', str(val))
-                except Exception:
-                    pass
-                try:
-                    self.app.append_log(f"Drive {self.drive_id} wrote param {pid} = {val}")
-                except Exception:
-                    pass
-            except Exception as e:
-                messagebox.showerror('Write error', str(e))
-        except Exception:
-            pass
+                    self.transport.send_and_receive(_build_request(self.drive_id, 0x06, addr, val))
+                except Exception as e:
+                    self.tk_parent.after(0, (lambda exc=e: messagebox.showerror('Write error', str(exc))))
+                    return
+                self.tk_parent.after(0, done)
 
-    def _toggle_status_fav(self, func_str, tree):
-        """Toggle favorite for a status row (func_str '04' or '03')."""
-        try:
-            sel = tree.selection()
-            if not sel:
-                return
-            for iid in sel:
-                fav_key = f's:{func_str}:{iid}'
-                self.app.toggle_favorite(self.drive_id, fav_key)
-            # refresh views
-            try:
-                self.refresh_local_favorites()
-            except Exception:
-                pass
-            try:
-                self.app.refresh_global_favorites()
-            except Exception:
-                pass
+            self.app.submit_io(worker)
         except Exception:
             pass
 
     def _on_status_tree_click(self, event, func_str, tree):
         """Handle single-clicks in the status tree. Toggle favorite when star column clicked."""
+        # star column is '#1'
+        if tree.identify_column(event.x) != '#1':
+            return
+        iid = tree.identify_row(event.y)
+        if not iid:
+            return
+        # iid may already be 's:04:16'
+        fav_key = iid if iid.startswith('s:') else f's:{func_str}:{iid}'
+        isfav = self.app.toggle_favorite(self.drive_id, fav_key)
+        if isfav:
+            self._fav_set.add(fav_key)
+        else:
+            self._fav_set.discard(fav_key)
+        # update star and row tag color immediately for this drive
+        tree.set(iid, 'star', '★' if isfav else '☆')
+        tree.item(iid, tags=('fav' if isfav else 'nofav',))
         try:
-            col = tree.identify_column(event.x)
-            row = tree.identify_row(event.y)
-            if not row:
-                return
-            # star column is '#1'
-            if col == '#1':
-                iid = row
-                # iid may already be 's:04:16'
-                if not iid.startswith('s:'):
-                    fav_key = f's:{func_str}:{iid}'
-                else:
-                    fav_key = iid
-                self.app.toggle_favorite(self.drive_id, fav_key)
-                # update visual immediately for this drive
-                try:
-                    current = set(self.app.config.get('favorites', {}).get(str(self.drive_id), []))
-                    self.apply_favorite_states(current)
-                except Exception:
-                    pass
-                try:
-                    self.app.refresh_global_favorites()
-                except Exception:
-                    pass
-                # update row tag color
-                try:
-                    isfav = fav_key in set(self.app.config.get('favorites', {}).get(str(self.drive_id), []))
-                    tag = 'fav' if isfav else 'nofav'
-                    tree.item(iid, tags=(tag,))
-                except Exception:
-                    pass
+            self.app.schedule_refresh_global_favorites()
         except Exception:
             pass
 
     def apply_favorite_states(self, favs):
-        """Update star visuals for parameters and status rows using favs (iterable of fav keys)."""
-        try:
-            fav_set = set(favs) if not isinstance(favs, set) else favs
-        except Exception:
-            fav_set = set()
-        # update parameter stars
+        """Update star visuals for parameters and status rows using favs (iterable of fav keys).
+
+        Only rows whose state differs from the cached set are touched.
+        """
+        fav_set = favs if isinstance(favs, set) else set(favs)
+        changed = fav_set ^ self._fav_set
+        # the config was changed elsewhere (global favorites); adopt it as the cached set
+        self._fav_set = fav_set
+        for key in changed:
+            if not isinstance(key, str):
+                # legacy numeric entries have no row of their own
+                continue
+            isfav = key in fav_set
+            star = '★' if isfav else '☆'
+            if key.startswith('p:'):
+                pid = key[2:]
+                # param_widgets only holds rows of the live tab (destroy() clears it)
+                tree = self.param_widgets.get(pid)
+                if tree is not None:
+                    tree.set(pid, 'star', star)
+            elif key.startswith('s:'):
+                # 's:04:16' -> status_tree_04 (skipped until that page is built)
+                tree = getattr(self, f'status_tree_{key[2:4]}', None)
+                if tree is not None and tree.exists(key):
+                    tree.set(key, 'star', star)
+                    tree.item(key, tags=('fav' if isfav else 'nofav',))
+
+    def get_param_value(self, pid):
+        """Return the Value cell text of parameter `pid` ('' if it has no row)."""
+        tree = self.param_widgets.get(str(pid))
+        return tree.set(str(pid), 'value') if tree is not None else ''
+
+    def set_param_value(self, pid, value):
+        """Show `value` in the Value cell of parameter `pid`; call from the Tk thread."""
+        tree = self.param_widgets.get(str(pid))
+        if tree is not None:
+            tree.set(str(pid), 'value', str(value))
+            self._set_fav_value(f'p:{pid}', str(value))
+
+    def _set_fav_value(self, key, text):
+        # mirror a value into the local favorites row `key`, if it is one (and
+        # the favorites page has been built)
+        if key not in self._fav_set:
+            return
+        fav_tree = getattr(self, 'fav_tree', None)
+        if fav_tree is not None and fav_tree.winfo_exists() and fav_tree.exists(key):
+            fav_tree.set(key, 'value', text)
+        self.app.set_global_fav_value(self.drive_id, key, text)
+
+    def _on_param_tree_click(self, event, tree):
+        """Toggle the favorite when the star column of a parameter row is clicked."""
+        if not self._params_enabled or tree.identify_column(event.x) != '#1':
+            return
+        iid = tree.identify_row(event.y)
+        if not iid:
+            return
+        key = f'p:{iid}'
+        new_state = self.app.toggle_favorite(self.drive_id, key)
+        if new_state:
+            self._fav_set.add(key)
+        else:
+            self._fav_set.discard(key)
+        tree.set(iid, 'star', '★' if new_state else '☆')
+        # refresh local and global favorite views
         try:
-            for pid, widgets in list(self.param_widgets.items()):
-                try:
-                    fav_key = f'p:{pid}'
-                    star = '★' if fav_key in fav_set else '☆'
-                    if isinstance(widgets, dict):
-                        btn = widgets.get('star')
-                        if btn:
-                            btn.config(text=star)
-                    else:
-                        # legacy tuple: star is last element
-                        try:
-                            widgets[-1].config(text=star)
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+            self.refresh_local_favorites()
         except Exception:
             pass
-        # update status tree stars
         try:
-            for tree_attr in ('status_tree_04', 'status_tree_03'):
-                tree = getattr(self, tree_attr, None)
-                if tree is None:
-                    continue
-                for iid in tree.get_children():
-                    try:
-                        # iid expected format 's:04:16' or 's:03:10'
-                        isfav = iid in fav_set
-                        star = '★' if isfav else '☆'
-                        tree.set(iid, 'star', star)
-                    except Exception:
-                        pass
+            self.app.schedule_refresh_global_favorites()
         except Exception:
             pass
 
-    def read_param(self, p, label):
+    def _edit_param_cell(self, event, tree):
+        """Open an Entry over the double-clicked Value cell; Enter/focus-out keeps the text, Escape drops it."""
+        if not self._params_enabled or tree.identify_column(event.x) != '#5':
+            return
+        iid = tree.identify_row(event.y)
+        bbox = tree.bbox(iid, 'value') if iid else None
+        if not bbox:
+            return
+        x, y, w, h = bbox
+        editor = ttk.Entry(tree, justify='right')
+        editor.insert(0, tree.set(iid, 'value'))
+        editor.select_range(0, 'end')
+        editor.place(x=x, y=y, width=w, height=h)
+        editor.focus_set()
+        open_ = [True]
+
+        def close(keep):
+            if not open_[0]:
+                return
+            open_[0] = False
+            if keep:
+                self.set_param_value(iid, editor.get().strip())
+            editor.destroy()
+
+        editor.bind('<Return>', lambda e: close(True))
+        editor.bind('<KP_Enter>', lambda e: close(True))
+        editor.bind('<FocusOut>', lambda e: close(True))
+        editor.bind('<Escape>', lambda e: close(False))
+
+    def read_selected_params(self, tree):
+        """Read every selected parameter row from the drive."""
+        for iid in tree.selection():
+            p = self._params_by_id.get(iid)
+            if p:
+                self.read_param(p)
+
+    def write_selected_params(self, tree):
+        """Write the Value cell of every selected parameter row to the drive."""
+        for iid in tree.selection():
+            p = self._params_by_id.get(iid)
+            if p:
+                self.write_param(p)
+
+    def read_param(self, p):
         def worker():
             try:
-                addr = int(p['id'])
-                req = struct.pack('>B B H H', self.drive_id, 0x03, addr, 1)
-                crc = compute_crc(req)
-                req += struct.pack('<H', crc)
-                resp = self.transport.send_and_receive(req)
-                byte_num = resp[2]
-                data = resp[3:3+byte_num]
-                if len(data) >= 2:
-                    val = data[0] << 8 | data[1]
-                elif len(data) == 1:
-                    val = data[0]
-                else:
-                    val = 0
-                self.tk_parent.after(0, lambda: label.delete(0, 'end') or label.insert(0, str(val)))
+                val = self._read_registers(p.id, 1)[0]
+                self.tk_parent.after(0, self.set_param_value, p.id, val)
             except Exception as e:
                 self.tk_parent.after(0, (lambda exc=e: messagebox.showerror('Read error', str(exc))))
-        threading.Thread(target=worker, daemon=True).start()
+        self.app.submit_io(worker, key=('param', self.drive_id, p.id))
 
     def read_fav(self, fav):
         """Read a single favorite entry (p:<id> or s:<func>:<addr>)."""
         try:
-            if isinstance(fav, str) and fav.startswith('p:'):
-                pid = fav.split(':',1)[1]
-                p = next((x for x in self.params if str(x.get('id','')) == str(pid)), None)
-                if not p:
-                    return
-                widgets = self.param_widgets.get(str(pid))
-                if not widgets:
-                    return
-                entry = widgets.get('entry') if isinstance(widgets, dict) else widgets[0]
-                # reuse existing read_param logic
-                self.read_param(p, entry)
-            elif isinstance(fav, str) and fav.startswith('s:'):
-                parts = fav.split(':')
-                func = int(parts[1]) if len(parts) > 1 else 4
-                addr = int(parts[2]) if len(parts) > 2 else None
-                if addr is None:
-                    return
-                self.read_status_item(func, addr)
-            else:
-                # legacy numeric
-                pid = fav
-                p = next((x for x in self.params if str(x.get('id','')) == str(pid)), None)
-                if not p:
-                    return
-                widgets = self.param_widgets.get(str(pid))
-                if not widgets:
-                    return
-                entry = widgets.get('entry') if isinstance(widgets, dict) else widgets[0]
-                self.read_param(p, entry)
+            parsed = _parse_fav(fav)
+            if parsed is None:
+                return
+            if parsed[0] == 's':
+                self.read_status_item(parsed[1], parsed[2])
+                return
+            # 'p:<id>' or legacy numeric
+            pid = parsed[1]
+            p = self._params_by_id.get(pid)
+            if not p or pid not in self.param_widgets:
+                return
+            # reuse existing read_param logic
+            self.read_param(p)
         except Exception:
             pass
 
     def read_status_item(self, func, addr):
         """Read a single status register and update the tree value."""
+        iid = f's:{func:02d}:{addr}'
+        # only a favorite row or a built status page can show the value; skip the
+        # bus round-trip when neither exists
+        tree = getattr(self, f'status_tree_{func:02d}', None)
+        if iid not in self._fav_set and (tree is None or not tree.exists(iid)):
+            return
+
         def worker():
             try:
                 vals = self.transport.read_status(self.drive_id, addr, 1, func=func)
                 if not vals:
                     return
-                v = vals[0]
-                iid = f's:{func:02d}:{addr}' if isinstance(func, int) else f's:{func}:{addr}'
-                # try update both trees if exists
-                try:
-                    if hasattr(self, 'status_tree_04') and self.status_tree_04.exists(iid):
-                        self.tk_parent.after(0, lambda: self.status_tree_04.set(iid, 'value', str(v)))
-                    if hasattr(self, 'status_tree_03') and self.status_tree_03.exists(iid):
-                        self.tk_parent.after(0, lambda: self.status_tree_03.set(iid, 'value', str(v)))
-                except Exception:
-                    pass
+                self.tk_parent.after(0, self._apply_status_value, iid, str(vals[0]))
             except Exception:
                 pass
-        threading.Thread(target=worker, daemon=True).start()
+        self.app.submit_io(worker, key=('status', self.drive_id, func, addr))
+
+    def write_param(self, p):
+        # take the text on the Tk thread; the worker only talks to the drive
+        vtext = self.get_param_value(p.id).strip()
 
-    def write_param(self, p, entry, label):
         def worker():
             try:
-                vtext = entry.get().strip()
                 if vtext == '':
                     raise ValueError('No value')
                 val = int(vtext)
-                addr = int(p['id'])
-                req = struct.pack('>B B H H', self.drive_id, 0x06, addr, val)
-                crc = compute_crc(req)
-                req += struct.pack('<H', crc)
+                addr = p.id
+                req = _build_request(self.drive_id, 0x06, addr, val)
                 resp = self.transport.send_and_receive(req)
                 self.tk_parent.after(0, lambda: None)
             except Exception as e:
                 self.tk_parent.after(0, (lambda exc=e: messagebox.showerror('Write error', str(exc))))
-        threading.Thread(target=worker, daemon=True).start()
+        self.app.submit_io(worker)
+
+    def _read_registers(self, start, count):
+        """Read `count` holding registers (function 0x03) from `start`; returns a tuple of ints."""
+        resp = self.transport.send_and_receive(read_request(self.drive_id, 0x03, start, count))
+        if resp[1] & 0x80:
+            raise IOError(f'Modbus exception {resp[2]:#04x}')
+        if resp[2] != 2 * count:
+            raise IOError(f'Expected {2 * count} data bytes, got {resp[2]}')
+        return unpack_registers(resp, 3, count)
 
     def read_all(self):
+        # (addr, param) for every parameter row, in address order; the rows are
+        # fixed once the tab is built, so sort them only on the first Read All
+        targets = self._read_all_targets
+        if targets is None:
+            targets = self._read_all_targets = sorted(
+                ((p.id, p) for p in self.params if str(p.id) in self.param_widgets),
+                key=lambda t: t[0])
+
         def worker():
             errors = []
-            for p in self.params:
-                widgets = self.param_widgets.get(str(p['id']))
-                if not widgets:
-                    continue
-                # support new dict or legacy tuple
-                if isinstance(widgets, dict):
-                    entry = widgets.get('entry')
-                else:
-                    entry = widgets[0]
+
+            def set_values(updates):
+                for pid, v in updates:
+                    self.set_param_value(pid, v)
+
+            # (addr, value) for every register read; shown with one Tk callback at the end
+            updates = []
+            read = self._read_registers
+            # read runs of contiguous addresses with one request each
+            i = 0
+            n = len(targets)
+            while i < n:
+                start = targets[i][0]
+                j = i + 1
+                while j < n and targets[j][0] == start + (j - i) and j - i < READ_ALL_MAX_REGS:
+                    j += 1
+                chunk = targets[i:j]
+                i = j
                 try:
-                    addr = int(p['id'])
-                    req = struct.pack('>B B H H', self.drive_id, 0x03, addr, 1)
-                    crc = compute_crc(req)
-                    req += struct.pack('<H', crc)
-                    resp = self.transport.send_and_receive(req)
-                    byte_num = resp[2]
-                    data = resp[3:3+byte_num]
-                    if len(data) >= 2:
-                        val = data[0] << 8 | data[1]
-                    elif len(data) == 1:
-                        val = data[0]
-                    else:
-                        val = 0
-                    # update UI
-                    self.tk_parent.after(0, lambda e=entry, v=val: (e.delete(0, 'end'), e.insert(0, str(v))))
-                except Exception as exc:
-                    errors.append(f"{p.get('name','id'+str(p.get('id')))}: {exc}")
+                    vals = read(start, len(chunk))
+                    updates.extend((addr, v) for (addr, _), v in zip(chunk, vals))
+                except TimeoutError as exc:
+                    # drive not answering: don't retry every register of the block
+                    errors.extend(f"{p.get('name','id'+str(p.get('id')))}: {exc}" for _, p in chunk)
+                except Exception:
+                    # the drive rejected the block (e.g. one unreadable register);
+                    # fall back to single reads so errors stay per parameter
+                    for addr, p in chunk:
+                        try:
+                            updates.append((addr, read(addr, 1)[0]))
+                        except Exception as exc:
+                            errors.append(f"{p.get('name','id'+str(p.get('id')))}: {exc}")
+            if updates:
+                self.tk_parent.after(0, set_values, updates)
             if errors:
                 # aggregate errors into a single dialog (limit to first 20 to avoid huge dialogs)
                 max_show = 20
@@ -924,97 +972,70 @@ class DriveTab:
                 msg = "\n".join(msg_lines)
                 self.tk_parent.after(0, lambda: messagebox.showerror('Read-All Errors', msg))
 
-        threading.Thread(target=worker, daemon=True).start()
-
-    def refresh_status(self):
-        """Read status registers (in chunks up to 8) and update the status tree."""
-        def worker():
-            try:
-                entries = sorted(self.status_entries, key=lambda x: int(x.get('id', 0)))
-                # build chunks of contiguous addresses up to 8 registers
-                i = 0
-                n = len(entries)
-                while i < n:
-                    start = int(entries[i]['id'])
-                    count = 1
-                    j = i + 1
-                    while j < n and int(entries[j]['id']) == start + count and count < 8:
-                        count += 1
-                        j += 1
-                    # perform read for this chunk
-                    vals = self.transport.read_status(self.drive_id, start, count, func=0x04)
-                    # update UI for each value
-                    for k, v in enumerate(vals):
-                        addr = start + k
-                        iid = str(addr)
-                        try:
-                            item = self.status_tree.item(iid)
-                            if item:
-                                vals_now = list(item.get('values', []))
-                                # values tuple: (id, name, value, units, desc)
-                                if len(vals_now) >= 3:
-                                    vals_now[2] = str(v)
-                                    self.tk_parent.after(0, lambda iid=iid, vlist=vals_now: self.status_tree.item(iid, values=vlist))
-                        except Exception:
-                            pass
-                    i = j
-            except Exception as e:
-                self.tk_parent.after(0, (lambda exc=e: messagebox.showerror('Status read error', str(exc))))
+        self.app.submit_io(worker, key=('read_all', self.drive_id))
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _refresh_status_generic(self, entries, func):
+        runs = self._status_runs.get(func)
+        if runs is None:
+            runs = self._status_runs[func] = _status_runs(s['id'] for s in entries)
 
-    def _refresh_status_generic(self, entries, tree, func):
         def worker():
+            # (iid, text) for the whole table; shown with one Tk callback
+            updates = []
+            read_status = self.transport.read_status
+            drive_id = self.drive_id
             try:
-                entries_sorted = sorted(entries, key=lambda x: int(x.get('id', 0)))
-                i = 0
-                n = len(entries_sorted)
-                while i < n:
-                    start = int(entries_sorted[i]['id'])
-                    count = 1
-                    j = i + 1
-                    while j < n and int(entries_sorted[j]['id']) == start + count and count < 8:
-                        count += 1
-                        j += 1
-                    vals = self.transport.read_status(self.drive_id, start, count, func=func)
-                    for k, v in enumerate(vals):
-                        addr = start + k
-                        iid = str(addr)
-                        try:
-                            item = tree.item(iid)
-                            if item:
-                                vals_now = list(item.get('values', []))
-                                if len(vals_now) >= 3:
-                                    vals_now[2] = str(v)
-                                    # update the tree item
-                                    self.tk_parent.after(0, lambda iid=iid, vlist=vals_now, t=tree: t.item(iid, values=vlist))
-                                    # autosize the column for 'value' if needed
-                                    try:
-                                        f = tkfont.nametofont(tree.cget('font'))
-                                    except Exception:
-                                        f = None
-                                    if f is not None:
-                                        # column id of value is the third column in tree['columns']
-                                        col_id = tree['columns'][2]
-                                        text_w = f.measure(str(vals_now[2]))
-                                        hdr_w = f.measure(tree.heading(col_id)['text'])
-                                        curr_w = tree.column(col_id)['width']
-                                        desired = max(text_w, hdr_w) + 20
-                                        if desired > curr_w:
-                                            self.tk_parent.after(0, lambda c=col_id, w=desired, t=tree: t.column(c, width=w))
-                        except Exception:
-                            pass
-                    i = j
+                for start, count in runs:
+                    vals = read_status(drive_id, start, count, func=func)
+                    updates.extend((f's:{func:02d}:{start + k}', str(v)) for k, v in enumerate(vals))
             except Exception as e:
                 self.tk_parent.after(0, (lambda exc=e: messagebox.showerror('Status read error', str(exc))))
-
-        threading.Thread(target=worker, daemon=True).start()
+            finally:
+                # values read before a failure are still shown
+                if updates:
+                    self.tk_parent.after(0, self._apply_status_updates, func, updates)
+
+        self.app.submit_io(worker, key=('status', self.drive_id, func))
+
+    def _apply_status_value(self, iid, text):
+        """Set the Value cell of one status row (and its favorite rows) on the Tk thread."""
+        # 's:04:…' rows live in status_tree_04, 's:03:…' in status_tree_03
+        tree = getattr(self, f'status_tree_{iid[2:4]}', None)
+        if tree is not None and tree.winfo_exists() and tree.exists(iid):
+            tree.set(iid, 'value', text)
+        self._set_fav_value(iid, text)
+
+    def _apply_status_updates(self, func, updates):
+        """Set the Value cell for each (iid, text) pair, then widen the Value column at most once."""
+        # looked up now: the tab may have been closed while the read was queued
+        tree = getattr(self, f'status_tree_{func:02d}', None)
+        if tree is None or not tree.winfo_exists():
+            return
+        texts = []
+        for iid, text in updates:
+            if tree.exists(iid):
+                tree.set(iid, 'value', text)
+                self._set_fav_value(iid, text)
+                texts.append(text)
+        if not texts:
+            return
+        # values are numbers drawn with equal-width digits, so only the longest
+        # strings can set the width; a refresh that grows no value skips measuring
+        longest = max(map(len, texts))
+        if longest <= self._status_value_chars.get(tree, 0):
+            return
+        self._status_value_chars[tree] = longest
+        measure = self.app.measure
+        hdr_w = measure(tree.heading('value')['text'])
+        desired = max(max(measure(t) for t in texts if len(t) == longest), hdr_w) + 20
+        if desired > int(tree.column('value')['width']):
+            tree.column('value', width=desired)
 
     def refresh_status_04(self):
-        self._refresh_status_generic(self.status_entries_04, self.status_tree_04, 0x04)
+        self._refresh_status_generic(self.status_entries_04, 0x04)
 
     def refresh_status_03(self):
-        self._refresh_status_generic(self.status_entries_03, self.status_tree_03, 0x03)
+        self._refresh_status_generic(self.status_entries_03, 0x03)
 
     def refresh_local_favorites_for_drive(self, drive_id):
         # helper to call drive tab refresh when App wants to refresh
@@ -1033,28 +1054,10 @@ class DriveTab:
             self.save_eeprom_btn.config(state=state)
             if hasattr(self, 'close_btn'):
                 self.close_btn.config(state=state)
-            for wid in self.param_widgets.values():
-                # support dict or tuple
-                if isinstance(wid, dict):
-                    entry = wid.get('entry')
-                    if entry:
-                        entry.config(state=state)
-                    if wid.get('read'):
-                        wid.get('read').config(state=state)
-                    if wid.get('write'):
-                        wid.get('write').config(state=state)
-                    if wid.get('star'):
-                        wid.get('star').config(state=state)
-                else:
-                    try:
-                        entry = wid[0]
-                        entry.config(state=state)
-                        if len(wid) > 1:
-                            wid[1].config(state=state)
-                        if len(wid) > 2:
-                            wid[2].config(state=state)
-                    except Exception:
-                        pass
+            # parameter pages: toolbar buttons, plus the star/edit handlers check the flag
+            self._params_enabled = enabled
+            for btn in self._param_btns:
+                btn.config(state=state)
         except Exception:
             pass
 
@@ -1062,27 +1065,28 @@ class DriveTab:
         # Write value 0x1234 to address 0x1001 using function 0x06
         addr = EEPROM_SAVE_ADDR
         val = EEPROM_SAVE_VALUE
+        # disable tab controls while saving
+        self._set_tab_enabled(False)
+
+        def done():
+            messagebox.showinfo('EEPROM', 'EEPROM save should be complete.')
+            self._set_tab_enabled(True)
 
         def worker():
             try:
-                # disable tab controls while saving
-                self.tk_parent.after(0, lambda: self._set_tab_enabled(False))
-                req = struct.pack('>B B H H', self.drive_id, 0x06, addr, val)
-                crc = compute_crc(req)
-                req += struct.pack('<H', crc)
+                req = _build_request(self.drive_id, 0x06, addr, val)
                 # send and don't expect immediate long response (drive will take time to save)
                 self.transport.send_and_receive(req)
-                # inform user and wait EEPROM_WAIT_SECONDS before re-enabling
-                self.tk_parent.after(0, lambda: messagebox.showinfo('EEPROM', f'Save command sent. Waiting ~{EEPROM_WAIT_SECONDS}s for EEPROM write.'))
-                time.sleep(EEPROM_WAIT_SECONDS)
-                self.tk_parent.after(0, lambda: messagebox.showinfo('EEPROM', 'EEPROM save should be complete.'))
             except Exception as e:
                 self.tk_parent.after(0, (lambda exc=e: messagebox.showerror('EEPROM save error', str(exc))))
-            finally:
-                # re-enable tab controls
                 self.tk_parent.after(0, lambda: self._set_tab_enabled(True))
+                return
+            # inform user and re-enable after EEPROM_WAIT_SECONDS; wait on a Tk timer
+            # so the serial worker is free for other requests in the meantime
+            self.tk_parent.after(0, lambda: messagebox.showinfo('EEPROM', f'Save command sent. Waiting ~{EEPROM_WAIT_SECONDS}s for EEPROM write.'))
+            self.tk_parent.after(int(EEPROM_WAIT_SECONDS * 1000), done)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self.app.submit_io(worker)
 
 
 class App:
@@ -1090,10 +1094,124 @@ class App:
         self.root = root
         self.root.title('RS485 Servo GUI')
         self.transport = SerialTransport(debug=bool(transport_debug))
-        self.params = load_parameters(xml_path)
+        # every Modbus job runs on this one thread in FIFO order, so requests
+        # from different tabs and buttons never interleave on the shared bus
+        self._io_jobs = queue.Queue()
+        # keys of queued jobs that have not started yet (see submit_io)
+        self._io_pending = set()
+        self._io_lock = threading.Lock()
+        threading.Thread(target=self._io_loop, daemon=True).start()
+        self.config_path = os.path.join('config', 'gui_settings.json')
+        self._config_dir = os.path.dirname(self.config_path)
+        # set once the settings directory is known to exist
+        self._config_dir_ready = False
+        # the definition files and the settings are independent; read them side by side.
+        # Only the settings are needed to build the window; the parameter and status
+        # tables are installed by _definitions_ready once parsed (drive tabs need them
+        # only after connecting), so the window shows without waiting for the XML.
+        ex = ThreadPoolExecutor(max_workers=4)
+        self._defs_futures = (
+            ex.submit(load_parameters, xml_path),
+            # status definitions for func 0x04 and 0x03
+            ex.submit(load_status, os.path.join('config', 'status_04.xml'), '04'),
+            ex.submit(load_status, os.path.join('config', 'status_03.xml'), '03'),
+        )
+        # the loader error, if any; without the tables no drive tab can be built
+        self._defs_error = None
+        f_config = ex.submit(self.load_config)
+        # let the workers finish on their own; nothing else is submitted
+        ex.shutdown(wait=False)
+        self.config = f_config.result()
+        # Treeview font and its measured string widths, shared by all drive tabs
+        self._font = _tree_font(self.root)
+        self._measure_cache = {}
+        # ensure favorites structure exists
+        if 'favorites' not in self.config:
+            self.config['favorites'] = {}
+        # drive id string -> set of favorite keys; toggle_favorite keeps
+        # config['favorites'] in step with it
+        self._fav_sets = {k: set(map(str, v)) for k, v in self.config['favorites'].items()}
+        # membership view of config['drives']; the list keeps the tab order
+        self._drives_set = set(self.config.get('drives', []))
+        # after() id of a pending deferred config write
+        self._save_job = None
+        # after_idle() id of a pending global favorites refresh
+        self._global_fav_refresh_job = None
+        # global favorites row iid -> (drive id, favorite key as stored in the config)
+        self._global_fav_keys = {}
+        # Auto-Read state (Tk thread only): pending after() job, start/stop
+        # generation, and consecutive failed sweeps / backoff level
+        self._auto_read_job = None
+        self._auto_read_gen = 0
+        self._auto_read_failures = 0
+        self._auto_read_backoff = 0
+        # favorites sweeps (I/O thread only): drive id -> consecutive sweeps without an
+        # answer, and drive id -> time.monotonic() before which sweeps skip the drive
+        self._drive_fails = {}
+        self._drive_retry_at = {}
+        # last state applied by enable_drive_controls (None: not yet set)
+        self._controls_enabled = None
+        # (monotonic time of last enumeration, port names)
+        self._ports_cache = (0.0, [])
+        # True while a background port enumeration is running (at most one at a time)
+        self._ports_refreshing = False
+        self._build_ui()
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
+        self.root.after(50, self._poll_definitions)
+        # don't show saved drives until connected
+        self._saved_drives = list(self.config.get('drives', []))
+
+    def _poll_definitions(self):
+        # install the definition tables as soon as the loaders are done
+        if not self._definitions_ready(wait=False):
+            if self._defs_futures is not None:
+                self.root.after(50, self._poll_definitions)
+            return
+        try:
+            self.refresh_global_favorites()
+        except Exception:
+            pass
+
+    def _definitions_ready(self, wait: bool = True) -> bool:
+        """Install the parsed parameter/status tables on first call after loading.
+
+        With `wait` the call blocks until the loaders finish; otherwise it returns
+        False while they are still running. Returns False (and with `wait` shows the
+        error) when a definitions file could not be loaded.
+        """
+        futures = self._defs_futures
+        if futures is None:
+            if self._defs_error is not None:
+                if wait:
+                    self._show_defs_error()
+                return False
+            return True
+        if not wait and not all(f.done() for f in futures):
+            return False
+        try:
+            params, status_04, status_03 = [f.result() for f in futures]
+        except Exception as e:
+            self._defs_futures = None
+            self._defs_error = e
+            self._show_defs_error()
+            return False
+        self._defs_futures = None
+        self.params = params
+        self.status_entries_04 = status_04
+        self.status_entries_03 = status_03
+        self.param_pages = split_param_pages(self.params)
+        # id lookups for the global favorites view
+        self._params_by_id = {str(p.id): p for p in self.params}
+        self._status_04_by_id = {s['id']: s for s in self.status_entries_04}
+        self._status_03_by_id = {s['id']: s for s in self.status_entries_03}
+        # contiguous register runs per status function, shared by every drive tab
+        self.status_plan = {
+            0x04: _status_runs(s['id'] for s in self.status_entries_04),
+            0x03: _status_runs(s['id'] for s in self.status_entries_03),
+        }
         # determine description column width (characters) based on longest description
         try:
-            f = tkfont.nametofont('TkDefaultFont')
+            f = self._font
             if self.params:
                 max_px = max((f.measure(p.get('description','')) for p in self.params))
             else:
@@ -1104,30 +1222,63 @@ class App:
         except Exception:
             desc_chars = 40
         self.desc_width_chars = desc_chars
-        # load status definitions for func 0x04 and 0x03
-        self.status_entries_04 = load_status(os.path.join('config', 'status_04.xml'))
-        self.status_entries_03 = load_status(os.path.join('config', 'status_03.xml'))
-        self.config_path = os.path.join('config', 'gui_settings.json')
-        self.config = self.load_config()
-        # ensure favorites structure exists
-        if 'favorites' not in self.config:
-            self.config['favorites'] = {}
-        self._build_ui()
-        # don't show saved drives until connected
-        self._saved_drives = list(self.config.get('drives', []))
+        return True
+
+    def _show_defs_error(self):
+        messagebox.showerror('Definitions error', f'Could not load the parameter/status definitions:\n{self._defs_error}')
+
+    def measure(self, text):
+        """Return the pixel width of `text` in the Treeview font; each distinct string is measured once."""
+        text = str(text)
+        w = self._measure_cache.get(text)
+        if w is None:
+            # rough fallback if the font could not be resolved
+            w = self._font.measure(text) if self._font is not None else 7 * len(text)
+            self._measure_cache[text] = w
+        return w
+
+    def submit_io(self, job, key=None):
+        """Queue `job` (a callable without arguments) for the serial worker thread.
+
+        A job with a `key` (e.g. ('status', drive_id, func)) is dropped while one
+        with the same key is still waiting, so repeated clicks don't pile up reads.
+        """
+        if key is not None:
+            with self._io_lock:
+                if key in self._io_pending:
+                    return
+                self._io_pending.add(key)
+        self._io_jobs.put((key, job))
+
+    def _io_loop(self):
+        while True:
+            key, job = self._io_jobs.get()
+            if key is not None:
+                # from here on a new request must run again, not merge with this one
+                with self._io_lock:
+                    self._io_pending.discard(key)
+            try:
+                job()
+            except Exception as e:
+                # jobs report their own errors; log anything else and keep the worker alive
+                self.root.after(0, self.append_log, f'Serial job failed: {e}')
 
     def _build_ui(self):
         conn = ttk.LabelFrame(self.root, text='Connection')
         conn.pack(fill='x', padx=6, pady=6)
 
         ttk.Label(conn, text='COM Port').grid(row=0, column=0, padx=4, pady=4)
-        self.port_cb = ttk.Combobox(conn, values=self.list_com_ports(), width=12)
+        # enumerating ports can take a while on some systems: fill the list from a
+        # background thread and re-check (cached) whenever the dropdown opens
+        self.port_cb = ttk.Combobox(conn, width=12, postcommand=self._update_port_list)
         self.port_cb.grid(row=0, column=1, padx=4, pady=4)
+        self._ports_refreshing = True
+        threading.Thread(target=self._init_port_list, daemon=True).start()
         if self.config.get('port'):
             self.port_cb.set(self.config.get('port'))
 
         ttk.Label(conn, text='Baudrate').grid(row=0, column=2, padx=4, pady=4)
-        self.baud_cb = ttk.Combobox(conn, values=[9600,19200,38400,57600,115200], width=10)
+        self.baud_cb = ttk.Combobox(conn, values=BAUD_RATES, width=10)
         self.baud_cb.set(115200)
         self.baud_cb.grid(row=0, column=3, padx=4, pady=4)
         if self.config.get('baud'):
@@ -1137,7 +1288,7 @@ class App:
                 pass
 
         ttk.Label(conn, text='Parity').grid(row=0, column=4, padx=4, pady=4)
-        self.par_cb = ttk.Combobox(conn, values=['N','E','O'], width=4)
+        self.par_cb = ttk.Combobox(conn, values=PARITIES, width=4)
         self.par_cb.set('N')
         self.par_cb.grid(row=0, column=5, padx=4, pady=4)
         if self.config.get('parity'):
@@ -1186,31 +1337,27 @@ class App:
         self.autoread_interval.pack(side='right')
         self.autoread_btn = ttk.Button(fav_top, text='Auto-Read: Off', command=self._toggle_autoread)
         self.autoread_btn.pack(side='right', padx=6)
-        # Replace the Treeview with a scrollable frame of inline rows (entry + read/write like parameters)
-        self.global_fav_rows = {}
+        # one row per favorite; the row iid is '{drive}|{fav key}'
         fav_list_container = ttk.Frame(self.global_fav_tab)
         fav_list_container.pack(fill='both', expand=True, padx=4, pady=4)
-        canvas = tk.Canvas(fav_list_container)
-        vsb = ttk.Scrollbar(fav_list_container, orient='vertical', command=canvas.yview)
+        fav_ops = ttk.Frame(fav_list_container)
+        fav_ops.pack(fill='x', pady=(0,4))
+        ttk.Button(fav_ops, text='Read Selected', command=self.read_selected_global_favorite).pack(side='left')
+        ttk.Button(fav_ops, text='Write Selected', command=self.write_selected_global_favorite).pack(side='left', padx=6)
+        cols = ('star', 'drive', 'param', 'desc', 'min', 'max', 'value')
+        self.global_fav_tree = ttk.Treeview(fav_list_container, columns=cols, show='headings', height=10)
+        vsb = ttk.Scrollbar(fav_list_container, orient='vertical', command=self.global_fav_tree.yview)
+        self.global_fav_tree.configure(yscrollcommand=vsb.set)
         vsb.pack(side='right', fill='y')
-        canvas.pack(side='left', fill='both', expand=True)
-        canvas.configure(yscrollcommand=vsb.set)
-        inner = ttk.Frame(canvas)
-        self._global_fav_inner = inner
-        canvas.create_window((0,0), window=inner, anchor='nw')
-        inner.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-        # header row for inline favorites
-        hdr = ttk.Frame(inner)
-        hdr.pack(fill='x', pady=(0,4))
-        ttk.Label(hdr, text='').grid(row=0, column=0, padx=2)
-        ttk.Label(hdr, text='Drive', width=8).grid(row=0, column=1)
-        ttk.Label(hdr, text='Param', width=12).grid(row=0, column=2)
-        ttk.Label(hdr, text='Description', width=40, anchor='w').grid(row=0, column=3)
-        ttk.Label(hdr, text='Min', width=8).grid(row=0, column=4)
-        ttk.Label(hdr, text='Max', width=8).grid(row=0, column=5)
-        ttk.Label(hdr, text='Value', width=12).grid(row=0, column=6)
-        ttk.Label(hdr, text='').grid(row=0, column=7)
-        # Buttons for operating on favorites are per-row now; keep no global read/write buttons
+        self.global_fav_tree.pack(side='left', fill='both', expand=True)
+        self.global_fav_tree.heading('star', text='')
+        self.global_fav_tree.column('star', width=28, anchor='center', stretch=False)
+        for c, h, w in (('drive', 'Drive', 60), ('param', 'Param', 90), ('desc', 'Description', 360),
+                        ('min', 'Min', 80), ('max', 'Max', 80), ('value', 'Value', 100)):
+            self.global_fav_tree.heading(c, text=h)
+            self.global_fav_tree.column(c, width=w, anchor='w' if c == 'desc' else 'e')
+        # single-click star column to remove the favorite
+        self.global_fav_tree.bind('<Button-1>', self._on_global_fav_click)
 
         # Log area for read results and errors
         try:
@@ -1237,19 +1384,47 @@ class App:
             pass
         # ensure any existing drive tabs show correct star states
         try:
-            favs_map = self.config.get('favorites', {})
             for did, dt in self.drive_tabs.items():
                 try:
-                    dt.apply_favorite_states(set(favs_map.get(str(did), [])))
+                    # a copy: the tab adopts the set it is given
+                    dt.apply_favorite_states(set(self._fav_sets.get(str(did), ())))
                 except Exception:
                     pass
         except Exception:
             pass
 
-    def list_com_ports(self):
-        ports = [p.device for p in serial.tools.list_ports.comports()]
+    def list_com_ports(self, refresh: bool = False):
+        """Return the COM port names, enumerating again at most every PORTS_CACHE_SECONDS."""
+        now = time.monotonic()
+        stamp, ports = self._ports_cache
+        if refresh or not stamp or now - stamp > PORTS_CACHE_SECONDS:
+            ports = [p.device for p in serial.tools.list_ports.comports()]
+            self._ports_cache = (now, ports)
         return ports
 
+    def _init_port_list(self):
+        # background thread; the starter has set _ports_refreshing
+        try:
+            ports = self.list_com_ports(refresh=True)
+        except Exception:
+            ports = None
+        self.root.after(0, self._port_list_done, ports)
+
+    def _port_list_done(self, ports):
+        self._ports_refreshing = False
+        if ports is not None:
+            self.port_cb.configure(values=ports)
+
+    def _update_port_list(self):
+        # runs on the Tk thread when the dropdown opens: show the cached list at
+        # once and enumerate in the background if it is stale; the list then
+        # updates in place
+        stamp, ports = self._ports_cache
+        self.port_cb.configure(values=ports)
+        if not self._ports_refreshing and (not stamp or time.monotonic() - stamp > PORTS_CACHE_SECONDS):
+            self._ports_refreshing = True
+            threading.Thread(target=self._init_port_list, daemon=True).start()
+
     def toggle_connect(self):
         if self.transport.ser and self.transport.ser.is_open:
             self.transport.close()
@@ -1294,6 +1469,8 @@ class App:
                     except Exception:
                         pass
             except Exception as e:
+                # the port may have gone away; enumerate afresh on the next dropdown
+                self._ports_cache = (0.0, self._ports_cache[1])
                 messagebox.showerror('Open error', str(e))
 
     def add_drive(self, did_str: str = None, save: bool = True):
@@ -1312,38 +1489,32 @@ class App:
         if not (self.transport.ser and self.transport.ser.is_open):
             messagebox.showwarning('Not connected', 'Connect to serial port first')
             return
-        tab = DriveTab(self.notebook, did, self.transport, self.params, self.root, self, close_callback=lambda d=did: self.remove_drive(d), status_entries_04=self.status_entries_04, status_entries_03=self.status_entries_03, desc_width_chars=self.desc_width_chars)
+        if not self._definitions_ready():
+            return
+        tab = DriveTab(self.notebook, did, self.transport, self.params, self.root, self, close_callback=lambda d=did: self.remove_drive(d), status_entries_04=self.status_entries_04, status_entries_03=self.status_entries_03, desc_width_chars=self.desc_width_chars, param_pages=self.param_pages, status_plan=self.status_plan)
         self.drive_tabs[did] = tab
+        # DriveTab draws the saved favorite stars while building its rows
         self.notebook.add(tab.frame, text=f'Drive {did}')
-        # apply saved favorites visuals for this drive
-        try:
-            favs = set(self.config.get('favorites', {}).get(str(did), []))
-            tab.apply_favorite_states(favs)
-        except Exception:
-            pass
-        if save:
-            self.config.setdefault('drives', [])
-            if did not in self.config['drives']:
-                self.config['drives'].append(did)
+        if save and did not in self._drives_set:
+            self._drives_set.add(did)
+            self.config.setdefault('drives', []).append(did)
             self.save_config()
 
     def enable_drive_controls(self, enable: bool):
+        if self._controls_enabled == enable:
+            return
+        self._controls_enabled = enable
         state = 'normal' if enable else 'disabled'
-        try:
-            self.drive_entry.config(state=state)
-            self.add_drive_btn.config(state=state)
-        except Exception:
-            pass
+        self.drive_entry.config(state=state)
+        self.add_drive_btn.config(state=state)
 
     def hide_all_drives(self):
-        # remove all drive tabs from notebook but keep config
-        for did in list(self.drive_tabs.keys()):
-            try:
-                tab = self.drive_tabs[did]
-                self.notebook.forget(tab.frame)
-            except Exception:
-                pass
-            del self.drive_tabs[did]
+        # remove all drive tabs but keep config; show_saved_drives builds fresh
+        # ones on the next connect. Destroying a frame also drops its notebook tab.
+        tabs = list(self.drive_tabs.values())
+        self.drive_tabs.clear()
+        for tab in tabs:
+            tab.destroy()
 
     def show_saved_drives(self):
         # create tabs for drives in config if not already present
@@ -1356,12 +1527,17 @@ class App:
                 pass
 
     def remove_drive(self, did: int):
-        if did not in self.drive_tabs:
+        tab = self.drive_tabs.pop(did, None)
+        if tab is None:
             return
-        tab = self.drive_tabs[did]
-        # remove from notebook
+        # destroying the frame also removes it from the notebook
+        tab.destroy()
+        # remove from config and save
         try:
-            self.notebook.forget(tab.frame)
+            if did in self._drives_set:
+                self._drives_set.discard(did)
+                self.config['drives'].remove(did)
+                self.save_config()
         except Exception:
             pass
 
@@ -1391,205 +1567,142 @@ class App:
                 pass
         except Exception:
             pass
-        # delete internal
-        del self.drive_tabs[did]
-        # remove from config and save
-        try:
-            if 'drives' in self.config and did in self.config['drives']:
-                self.config['drives'].remove(did)
-            self.save_config()
-        except Exception:
-            pass
+
+    def on_close(self):
+        """Write pending settings, close the port and destroy the window."""
+        self.flush_config()
+        self.transport.close()
+        self.root.destroy()
 
     def load_config(self):
+        # serialized settings as last read/written; flush_config skips identical rewrites
+        self._last_config_bytes = None
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception:
+            with open(self.config_path, 'rb') as f:
+                raw = f.read()
+            self._config_dir_ready = True
+            config = _load_config(raw)
+            self._last_config_bytes = raw
+            return config
+        except (OSError, ValueError):
+            # missing (first start), unreadable or not valid JSON: start with defaults
             pass
         return {}
 
     def toggle_favorite(self, drive_id, param_id):
         """Toggle favorite state for drive_id and param_id. Returns True if now favorite."""
         try:
-            favs = self.config.setdefault('favorites', {})
             key = str(drive_id)
-            lst = set(map(str, favs.get(key, [])))
+            lst = self._fav_sets.setdefault(key, set())
             pid = str(param_id)
             # backward compatibility: treat bare numeric as parameter
             if not (pid.startswith('p:') or pid.startswith('s:')):
-                pid = 'p:' + pid
+                pid = f'p:{pid}'
             if pid in lst:
                 lst.remove(pid)
-                favs[key] = list(lst)
-                self.save_config()
-                return False
+                isfav = False
             else:
                 lst.add(pid)
-                favs[key] = list(lst)
-                self.save_config()
-                return True
+                isfav = True
+            self.config.setdefault('favorites', {})[key] = list(lst)
+            self.save_config()
+            return isfav
         except Exception:
             return False
 
+    def schedule_refresh_global_favorites(self):
+        """Refresh the global favorites view once the current Tk event is handled.
+
+        Star clicks that land in the same event loop tick share one refresh.
+        """
+        if self._global_fav_refresh_job is None:
+            self._global_fav_refresh_job = self.root.after_idle(self._run_global_fav_refresh)
+
+    def _run_global_fav_refresh(self):
+        self._global_fav_refresh_job = None
+        self.refresh_global_favorites()
+
     def refresh_global_favorites(self):
-        # Build or refresh the inline global favorites list (rows with entries + Read/Write)
+        # Sync the global favorites tree with the config: rows of removed favorites
+        # are deleted, new ones inserted and the rest updated in place
         try:
-            if not getattr(self, '_global_fav_inner', None):
+            # until the definitions are in, _poll_definitions refreshes once they are
+            if not getattr(self, 'global_fav_tree', None) or not self._definitions_ready(wait=False):
                 return
-            # clear existing rows (keep header)
-            children = list(self._global_fav_inner.winfo_children())
-            for child in children[1:]:
-                try:
-                    child.destroy()
-                except Exception:
-                    pass
-            self.global_fav_rows = {}
+            gtree = self.global_fav_tree
+            old_rows = set(gtree.get_children())
+            rows = {}
+            keys = {}
             favs = self.config.get('favorites', {})
+            params_by_id = self._params_by_id
+            drive_tabs = self.drive_tabs
             for did_str, plist in favs.items():
-                try:
-                    did = int(did_str)
-                except Exception:
+                # drive keys are written by the app itself, always decimal strings
+                if not did_str.isdigit():
                     continue
+                did = int(did_str)
+                dt = drive_tabs.get(did)
+                tree04 = getattr(dt, 'status_tree_04', None)
+                tree03 = getattr(dt, 'status_tree_03', None)
                 for fav in plist:
-                    try:
-                        desc = ''
-                        val = ''
-                        label = fav
-                        min_val = ''
-                        max_val = ''
-                        # parameter favorite: 'p:<id>' or legacy numeric
-                        if isinstance(fav, str) and fav.startswith('p:'):
-                            pid = fav.split(':',1)[1]
-                            pinfo = next((p for p in self.params if str(p.get('id','')) == str(pid)), None)
-                            desc = pinfo.get('description','') if pinfo else ''
-                            if pinfo:
-                                min_val = pinfo.get('min','')
-                                max_val = pinfo.get('max','')
-                            dt = self.drive_tabs.get(did)
-                            if dt:
-                                try:
-                                    w = dt.param_widgets.get(str(pid))
-                                    if w:
-                                        if isinstance(w, dict):
-                                            val = w.get('entry').get()
-                                        else:
-                                            val = w[0].get()
-                                except Exception:
-                                    val = ''
-                            label = pid
-                        elif isinstance(fav, str) and fav.startswith('s:'):
-                            parts = fav.split(':')
-                            func = parts[1] if len(parts) > 1 else '04'
-                            addr = parts[2] if len(parts) > 2 else parts[-1]
-                            try:
-                                sid = int(addr)
-                            except Exception:
-                                sid = None
-                            if func == '03':
-                                entry = next((s for s in self.status_entries_03 if int(s.get('id',0)) == sid), None)
-                                tree = getattr(self.drive_tabs.get(did), 'status_tree_03', None) if self.drive_tabs.get(did) else None
-                            else:
-                                entry = next((s for s in self.status_entries_04 if int(s.get('id',0)) == sid), None)
-                                tree = getattr(self.drive_tabs.get(did), 'status_tree_04', None) if self.drive_tabs.get(did) else None
-                            if entry:
-                                desc = entry.get('description','')
-                                val = entry.get('value','')
-                            try:
-                                iid = f's:{func}:{sid}' if sid is not None else None
-                                if tree is not None and iid is not None and tree.exists(iid):
-                                    val = tree.set(iid, 'value')
-                            except Exception:
-                                pass
-                            label = f"s{func}:{addr}"
-                        else:
-                            # legacy numeric pid
-                            pid = fav
-                            pinfo = next((p for p in self.params if str(p.get('id','')) == str(pid)), None)
-                            desc = pinfo.get('description','') if pinfo else ''
-                            if pinfo:
-                                min_val = pinfo.get('min','')
-                                max_val = pinfo.get('max','')
-                            dt = self.drive_tabs.get(did)
-                            if dt:
-                                try:
-                                    w = dt.param_widgets.get(str(pid))
-                                    if w:
-                                        if isinstance(w, dict):
-                                            val = w.get('entry').get()
-                                        else:
-                                            val = w[0].get()
-                                except Exception:
-                                    val = ''
-
-                        # create inline row
-                        row = ttk.Frame(self._global_fav_inner)
-                        row.pack(fill='x', pady=2)
-                        star_txt = '★'
-                        star_btn = ttk.Button(row, text=star_txt, width=2)
-                        star_btn.grid(row=0, column=0, padx=2)
-                        drv_lbl = ttk.Label(row, text=str(did), width=8)
-                        drv_lbl.grid(row=0, column=1)
-                        param_lbl = ttk.Label(row, text=label, width=12)
-                        param_lbl.grid(row=0, column=2)
-                        desc_lbl = ttk.Label(row, text=desc, width=40, anchor='w')
-                        desc_lbl.grid(row=0, column=3, sticky='w')
-                        min_lbl = ttk.Label(row, text=str(min_val), width=8, anchor='e')
-                        min_lbl.grid(row=0, column=4)
-                        max_lbl = ttk.Label(row, text=str(max_val), width=8, anchor='e')
-                        max_lbl.grid(row=0, column=5)
-                        entry = ttk.Entry(row, width=12)
-                        try:
-                            entry.delete(0, 'end')
-                        except Exception:
-                            pass
-                        entry.insert(0, str(val))
-                        entry.grid(row=0, column=6, padx=6)
-                        read_btn = ttk.Button(row, text='Read', width=6, command=partial(self._global_read, did, fav, entry))
-                        read_btn.grid(row=0, column=7, padx=(4,2))
-                        # Do not create a write button for status favorites
-                        if isinstance(fav, str) and fav.startswith('s:'):
-                            write_btn = ttk.Label(row, text='', width=6)
-                            write_btn.grid(row=0, column=8, padx=(2,4))
+                    desc = ''
+                    val = ''
+                    label = fav
+                    min_val = ''
+                    max_val = ''
+                    parsed = _parse_fav(fav)
+                    # parameter favorite: 'p:<id>' or legacy numeric
+                    if parsed is not None and parsed[0] == 'p':
+                        pid = parsed[1]
+                        pinfo = params_by_id.get(pid)
+                        if pinfo:
+                            desc = pinfo.get('description','')
+                            min_val = pinfo.get('min','')
+                            max_val = pinfo.get('max','')
+                        if dt:
+                            val = dt.get_param_value(pid)
+                        label = pid
+                    elif parsed is not None:
+                        _, func, sid = parsed
+                        if func == 0x03:
+                            entry = self._status_03_by_id.get(sid)
+                            tree = tree03
                         else:
-                            write_btn = ttk.Button(row, text='Write', width=6, command=partial(self._global_write, did, fav, entry))
-                            write_btn.grid(row=0, column=8, padx=(2,4))
-
-                        def _toggle(d=did, f=fav, btn=star_btn):
-                            try:
-                                new = self.toggle_favorite(d, f)
-                                btn.config(text='★' if new else '☆')
-                                # refresh both local and global views
-                                try:
-                                    self.refresh_global_favorites()
-                                except Exception:
-                                    pass
-                                try:
-                                    dt = self.drive_tabs.get(d)
-                                    if dt:
-                                        dt.refresh_local_favorites()
-                                        dt.apply_favorite_states(set(self.config.get('favorites', {}).get(str(d), [])))
-                                except Exception:
-                                    pass
-                            except Exception:
-                                pass
-
-                        star_btn.config(command=_toggle)
-                        # store widgets for potential updates
-                        row_iid = f"{did_str}|{fav}"
-                        self.global_fav_rows[row_iid] = {
-                            'frame': row,
-                            'star': star_btn,
-                            'entry': entry,
-                            'read': read_btn,
-                            'write': write_btn,
-                        }
-                    except Exception:
-                        pass
+                            entry = self._status_04_by_id.get(sid)
+                            tree = tree04
+                        if entry:
+                            desc = entry.get('description','')
+                            val = entry.get('value','')
+                        iid = f's:{func:02d}:{sid}'
+                        if tree is not None and tree.exists(iid):
+                            val = tree.set(iid, 'value')
+                        label = f"s{func:02d}:{sid}"
+
+                    iid = f"{did_str}|{fav}"
+                    rows[iid] = ('★', did, label, desc, min_val, max_val, val)
+                    keys[iid] = (did, fav)
+            self._global_fav_keys = keys
+            gone = old_rows.difference(rows)
+            if gone:
+                gtree.delete(*gone)
+            # hide the data columns while filling so Tk does not lay out each row
+            gtree.configure(displaycolumns=())
+            for iid, values in rows.items():
+                if iid in old_rows:
+                    gtree.item(iid, values=values)
+                else:
+                    gtree.insert('', 'end', iid=iid, values=values)
+            gtree.configure(displaycolumns='#all')
         except Exception:
             pass
 
+    def set_global_fav_value(self, did, fav, text):
+        # mirror a value into the global favorites row of drive `did`, if shown
+        gtree = getattr(self, 'global_fav_tree', None)
+        iid = f"{did}|{fav}"
+        if gtree is not None and gtree.exists(iid):
+            gtree.set(iid, 'value', text)
+
     def read_selected_global_favorite(self):
         """Read the selected row in the global favorites tree."""
         try:
@@ -1597,19 +1710,10 @@ class App:
             if not sel:
                 return
             iid = sel[0]
-            # iid format: '{did}|{fav}'
-            try:
-                did_str, fav = iid.split('|', 1)
-            except Exception:
-                vals = self.global_fav_tree.item(iid, 'values')
-                if not vals:
-                    return
-                did_str = vals[1]
-                fav = vals[2]
-            try:
-                did = int(did_str)
-            except Exception:
+            key = self._global_fav_keys.get(iid)
+            if key is None:
                 return
+            did, fav = key
             # if drive tab present, delegate to it
             dt = self.drive_tabs.get(did)
             if dt:
@@ -1619,136 +1723,34 @@ class App:
                 except Exception:
                     pass
                 return
-            # otherwise perform direct transport read
-            try:
-                if isinstance(fav, str) and fav.startswith('p:'):
-                    pid = fav.split(':',1)[1]
-                    addr = int(pid)
-                    vals = self.transport.read_status(did, addr, 1, func=0x03)
-                    if vals:
-                        v = vals[0]
-                        # update tree value column
-                        self.global_fav_tree.set(iid, 'value', str(v))
-                        self.append_log(f"Drive {did} Param {pid}: OK -> {v}")
-                    else:
-                        self.append_log(f"Drive {did} Param {pid}: no response")
-                elif isinstance(fav, str) and fav.startswith('s:'):
-                    parts = fav.split(':')
-                    if len(parts) >= 3:
-                        func = int(parts[1])
-                        addr = int(parts[2])
-                        vals = self.transport.read_status(did, addr, 1, func=func)
-                        if vals:
-                            v = vals[0]
-                            self.global_fav_tree.set(iid, 'value', str(v))
-                            self.append_log(f"Drive {did} Status {addr}: OK -> {v}")
-                        else:
-                            self.append_log(f"Drive {did} Status {addr}: no response")
-                else:
-                    # legacy numeric
-                    pid = str(fav)
-                    addr = int(pid)
-                    vals = self.transport.read_status(did, addr, 1, func=0x03)
-                    if vals:
-                        v = vals[0]
-                        self.global_fav_tree.set(iid, 'value', str(v))
-                        self.append_log(f"Drive {did} Param {pid}: OK -> {v}")
-                    else:
-                        self.append_log(f"Drive {did} Param {pid}: no response")
-            except Exception as e:
-                try:
-                    self.append_log(f"Read selected failed: {e}")
-                except Exception:
-                    pass
-        except Exception:
-            pass
+            # otherwise read straight from the drive
+            parsed = _parse_fav(fav)
+            if parsed is None:
+                return
+            if parsed[0] == 'p':
+                # 'p:<id>' or legacy numeric
+                func, addr, what = 0x03, int(parsed[1]), f"Param {parsed[1]}"
+            else:
+                _, func, addr = parsed
+                what = f"Status {addr}"
 
-    def _global_read(self, did, fav, entry_widget):
-        """Read favorite and place result into provided entry widget."""
-        try:
-            # delegate to drive tab if exists
-            dt = self.drive_tabs.get(did)
-            if dt:
+            def done(v):
+                # update tree value column
+                self.set_global_fav_value(did, fav, str(v))
+                self.append_log(f"Drive {did} {what}: OK -> {v}")
+
+            def worker():
                 try:
-                    dt.read_fav(fav)
-                except Exception:
-                    pass
-                return
-            # otherwise direct transport
-            if isinstance(fav, str) and fav.startswith('p:'):
-                pid = fav.split(':',1)[1]
-                addr = int(pid)
-                vals = self.transport.read_status(did, addr, 1, func=0x03)
+                    vals = self.transport.read_status(did, addr, 1, func=func)
+                except Exception as e:
+                    self.root.after(0, self.append_log, f"Read selected failed: {e}")
+                    return
                 if vals:
-                    v = vals[0]
-                    try:
-                        entry_widget.delete(0, 'end')
-                        entry_widget.insert(0, str(v))
-                    except Exception:
-                        pass
-                    try:
-                        self.append_log(f"Drive {did} Param {pid}: OK -> {v}")
-                    except Exception:
-                        pass
+                    self.root.after(0, done, vals[0])
                 else:
-                    try:
-                        self.append_log(f"Drive {did} Param {pid}: no response")
-                    except Exception:
-                        pass
-            elif isinstance(fav, str) and fav.startswith('s:'):
-                parts = fav.split(':')
-                if len(parts) >= 3:
-                    func = int(parts[1])
-                    addr = int(parts[2])
-                    vals = self.transport.read_status(did, addr, 1, func=func)
-                    if vals:
-                        v = vals[0]
-                        try:
-                            entry_widget.delete(0, 'end')
-                            entry_widget.insert(0, str(v))
-                        except Exception:
-                            pass
-                        try:
-                            self.append_log(f"Drive {did} Status {addr}: OK -> {v}")
-                        except Exception:
-                            pass
-                    else:
-                        try:
-                            self.append_log(f"Drive {did} Status {addr}: no response")
-                        except Exception:
-                            pass
-        except Exception:
-            pass
+                    self.root.after(0, self.append_log, f"Drive {did} {what}: no response")
 
-    def _global_write(self, did, fav, entry_widget):
-        """Write the integer value currently in entry_widget to the favorite (if param)."""
-        try:
-            if isinstance(fav, str) and fav.startswith('s:'):
-                messagebox.showwarning('Write', 'Cannot write to status favorites')
-                return
-            # resolve pid
-            if isinstance(fav, str) and fav.startswith('p:'):
-                pid = fav.split(':',1)[1]
-            else:
-                pid = str(fav)
-            try:
-                vtext = entry_widget.get().strip()
-                val = int(vtext)
-            except Exception:
-                messagebox.showwarning('Invalid', 'Value must be integer')
-                return
-            addr = int(pid)
-            try:
-                req = struct.pack('>B B H H', did, 0x06, addr, val)
-                crc = compute_crc(req)
-                req += struct.pack('<H', crc)
-                self.transport.send_and_receive(req)
-                try:
-                    self.append_log(f"Drive {did} wrote param {pid} = {val}")
-                except Exception:
-                    pass
-            except Exception as e:
-                messagebox.showerror('Write error', str(e))
+            self.submit_io(worker, key=('global_fav', did, func, addr))
         except Exception:
             pass
 
@@ -1759,26 +1761,15 @@ class App:
             if not sel:
                 return
             iid = sel[0]
-            try:
-                did_str, fav = iid.split('|', 1)
-            except Exception:
-                vals = self.global_fav_tree.item(iid, 'values')
-                if not vals:
-                    return
-                did_str = vals[1]
-                fav = vals[2]
-            try:
-                did = int(did_str)
-            except Exception:
+            key = self._global_fav_keys.get(iid)
+            if key is None:
                 return
-            if isinstance(fav, str) and fav.startswith('s:'):
+            did, fav = key
+            parsed = _parse_fav(fav)
+            if parsed is None or parsed[0] == 's':
                 messagebox.showwarning('Write', 'Cannot write to status favorites')
                 return
-            # resolve pid
-            if isinstance(fav, str) and fav.startswith('p:'):
-                pid = fav.split(':',1)[1]
-            else:
-                pid = str(fav)
+            pid = parsed[1]
             v = simpledialog.askstring('Write Parameter', f'Value for parameter {pid} (Drive {did}):')
             if v is None:
                 return
@@ -1787,23 +1778,22 @@ class App:
             except Exception:
                 messagebox.showwarning('Invalid', 'Value must be integer')
                 return
-            try:
-                addr = int(pid)
-                req = struct.pack('>B B H H', did, 0x06, addr, val)
-                crc = compute_crc(req)
-                req += struct.pack('<H', crc)
-                self.transport.send_and_receive(req)
+            addr = int(pid)
+
+            def done():
                 # update UI
+                self.set_global_fav_value(did, fav, str(val))
+                self.append_log(f"Drive {did} wrote param {pid} = {val}")
+
+            def worker():
                 try:
-                    self.global_fav_tree.set(iid, 'value', str(val))
-                except Exception:
-                    pass
-                try:
-                    self.append_log(f"Drive {did} wrote param {pid} = {val}")
-                except Exception:
-                    pass
-            except Exception as e:
-                messagebox.showerror('Write error', str(e))
+                    self.transport.send_and_receive(_build_request(did, 0x06, addr, val))
+                except Exception as e:
+                    self.root.after(0, (lambda exc=e: messagebox.showerror('Write error', str(exc))))
+                    return
+                self.root.after(0, done)
+
+            self.submit_io(worker)
         except Exception:
             pass
 
@@ -1821,32 +1811,22 @@ class App:
                 return
             # star column is '#1'
             if col == '#1':
-                # iid contains '{did}|{fav}'
-                try:
-                    did_str, fav = row.split('|', 1)
-                except Exception:
-                    # try to recover from values
-                    vals = tree.item(row, 'values')
-                    if not vals:
-                        return
-                    did_str = vals[1]
-                    fav = vals[2]
-                try:
-                    did = int(did_str)
-                except Exception:
+                key = self._global_fav_keys.get(row)
+                if key is None:
                     return
+                did, fav = key
                 # call toggle_favorite with drive and fav (fav may already include prefix)
                 try:
                     self.toggle_favorite(did, fav)
                 except Exception:
                     # older toggle_favorite might expect raw id; try prefixing
                     try:
-                        self.toggle_favorite(did, fav if (fav.startswith('p:') or fav.startswith('s:')) else ('p:' + fav))
+                        self.toggle_favorite(did, fav if (fav.startswith('p:') or fav.startswith('s:')) else f'p:{fav}')
                     except Exception:
                         pass
                 # refresh views
                 try:
-                    self.refresh_global_favorites()
+                    self.schedule_refresh_global_favorites()
                 except Exception:
                     pass
                 try:
@@ -1854,36 +1834,39 @@ class App:
                     dt = self.drive_tabs.get(did)
                     if dt:
                         dt.refresh_local_favorites()
-                        dt.apply_favorite_states(set(self.config.get('favorites', {}).get(str(did), [])))
-                        # also update the specific status row tag if applicable
-                        try:
-                            # fav may be like 'p:123' or 's:04:16' or legacy '123'
-                            if fav.startswith('s:'):
-                                iid = fav
-                                isfav = iid in set(self.config.get('favorites', {}).get(str(did), []))
-                                tag = 'fav' if isfav else 'nofav'
-                                if hasattr(dt, 'status_tree_04'):
-                                    try:
-                                        dt.status_tree_04.item(iid, tags=(tag,))
-                                    except Exception:
-                                        pass
-                                if hasattr(dt, 'status_tree_03'):
-                                    try:
-                                        dt.status_tree_03.item(iid, tags=(tag,))
-                                    except Exception:
-                                        pass
-                        except Exception:
-                            pass
+                        dt.apply_favorite_states(set(self._fav_sets.get(str(did), ())))
                 except Exception:
                     pass
         except Exception:
             pass
 
     def save_config(self):
+        """Schedule a settings write; changes within CONFIG_SAVE_DELAY_MS are written together."""
+        if self._save_job is None:
+            self._save_job = self.root.after(CONFIG_SAVE_DELAY_MS, self.flush_config)
+
+    def flush_config(self):
+        """Write the settings to disk now, replacing any pending deferred write."""
+        if self._save_job is not None:
+            try:
+                self.root.after_cancel(self._save_job)
+            except Exception:
+                pass
+            self._save_job = None
         try:
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            buf = _dump_config(self.config)
+            if buf == self._last_config_bytes:
+                return
+            if not self._config_dir_ready:
+                os.makedirs(self._config_dir, exist_ok=True)
+                self._config_dir_ready = True
+            # write a temp file and rename it over the old one, so a crash mid-write
+            # never leaves a truncated config (no fsync: losing the last change is fine)
+            tmp = self.config_path + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(buf)
+            os.replace(tmp, self.config_path)
+            self._last_config_bytes = buf
         except Exception as e:
             messagebox.showwarning('Config save failed', str(e))
 
@@ -1894,175 +1877,195 @@ class App:
             try:
                 errors = self._do_read_all_favorites(log_summary=False)
                 if errors:
-                    self.append_log(f"Read Favorites completed with {len(errors)} errors")
+                    msg = f"Read Favorites completed with {len(errors)} errors"
                 else:
-                    self.append_log("Read Favorites completed: all OK")
+                    msg = "Read Favorites completed: all OK"
             except Exception as e:
-                try:
-                    self.append_log(f"Read Favorites exception: {e}")
-                except Exception:
-                    pass
-        threading.Thread(target=bg, daemon=True).start()
+                msg = f"Read Favorites exception: {e}"
+            # after the value lines the sweep queued on the Tk thread
+            self.root.after(0, self.append_log, msg)
+        # repeated clicks while a sweep is still waiting don't queue another
+        self.submit_io(bg, key=('read_favorites',))
 
     def append_log(self, msg: str):
         """Append a timestamped line to the favorites log (if present).
 
         If the ScrolledText widget isn't available, falls back to printing.
         """
+        self.append_log_lines((msg,))
+
+    def append_log_lines(self, msgs):
+        """Append several timestamped lines to the favorites log with one widget update."""
         try:
             ts = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            line = f"[{ts}] {msg}\n"
+            text = ''.join(f"[{ts}] {msg}\n" for msg in msgs)
             if getattr(self, 'fav_log', None):
                 try:
                     self.fav_log.config(state='normal')
-                    self.fav_log.insert('end', line)
+                    self.fav_log.insert('end', text)
                     self.fav_log.see('end')
                     self.fav_log.config(state='disabled')
                 except Exception:
                     # if widget fails, fallback to stdout
-                    print(line.strip())
+                    print(text, end='')
             else:
-                print(line.strip())
+                print(text, end='')
         except Exception:
             pass
 
     def _do_read_all_favorites(self, log_summary: bool = True):
         """Synchronously read all favorites and write per-item status to the log.
 
-        Returns a list of error messages (possibly empty).
+        Favorites of the same drive and function with adjacent addresses are read
+        with one request. Returns a list of error messages (possibly empty).
         """
         errors = []
-        favs = self.config.get('favorites', {})
-        for did_str, plist in favs.items():
-            try:
-                did = int(did_str)
-            except Exception:
+        # log lines not shown yet, errors in order with values; handed to the Tk
+        # thread with one callback per (drive, function) group
+        lines = []
+
+        def fail(err):
+            errors.append(err)
+            lines.append(err)
+
+        def flush(dt=None, updates=()):
+            if lines or updates:
+                self.root.after(0, self._apply_fav_reads, dt, updates, lines[:])
+                del lines[:]
+
+        # (drive, func) -> {addr: [(label, pid or None, status iid or None), ...]}
+        wanted = {}
+        # runs on the I/O thread: snapshot the drive entries once; toggle_favorite
+        # replaces a drive's list rather than mutating it, so the lists need no copy
+        favs = tuple(self.config.get('favorites', {}).items())
+        for did_str, plist in favs:
+            if not did_str.isdigit():
                 continue
-            for fav in list(plist):
-                try:
-                    if isinstance(fav, str) and fav.startswith('p:'):
-                        pid = fav.split(':', 1)[1]
-                        try:
-                            addr = int(pid)
-                        except Exception:
-                            err = f"Drive {did} Param {pid}: invalid id"
-                            errors.append(err)
-                            self.append_log(err)
-                            continue
-                        try:
-                            vals = self.transport.read_status(did, addr, 1, func=0x03)
-                        except Exception as ex:
-                            err = f"Drive {did} Param {pid}: {ex}"
-                            errors.append(err)
-                            self.append_log(err)
-                            continue
-                        if not vals:
-                            err = f"Drive {did} Param {pid}: no response"
-                            errors.append(err)
-                            self.append_log(err)
-                            continue
-                        v = vals[0]
-                        # update UI if widget exists
-                        dt = self.drive_tabs.get(did)
-                        if dt:
-                            try:
-                                w = dt.param_widgets.get(str(pid))
-                                if w:
-                                    entry = w.get('entry') if isinstance(w, dict) else w[0]
-                                    self.root.after(0, lambda e=entry, vv=v: (e.delete(0, 'end'), e.insert(0, str(vv))))
-                            except Exception:
-                                pass
-                        self.append_log(f"Drive {did} Param {pid}: OK -> {v}")
-                    elif isinstance(fav, str) and fav.startswith('s:'):
-                        parts = fav.split(':')
-                        if len(parts) < 3:
-                            err = f"Drive {did} Status {fav}: malformed key"
-                            errors.append(err)
-                            self.append_log(err)
-                            continue
-                        try:
-                            func = int(parts[1])
-                            addr = int(parts[2])
-                        except Exception:
-                            err = f"Drive {did} Status {fav}: invalid func/addr"
-                            errors.append(err)
-                            self.append_log(err)
-                            continue
-                        try:
-                            vals = self.transport.read_status(did, addr, 1, func=func)
-                        except Exception as ex:
-                            err = f"Drive {did} Status {addr}: {ex}"
-                            errors.append(err)
-                            self.append_log(err)
-                            continue
-                        if not vals:
-                            err = f"Drive {did} Status {addr}: no response"
-                            errors.append(err)
-                            self.append_log(err)
-                            continue
-                        v = vals[0]
-                        # update UI tree if present
-                        dt = self.drive_tabs.get(did)
-                        iid = f's:{parts[1]}:{addr}'
-                        if dt:
-                            def _upd(dt=dt, iid=iid, v=v):
-                                try:
-                                    if hasattr(dt, 'status_tree_04') and dt.status_tree_04.exists(iid):
-                                        dt.status_tree_04.set(iid, 'value', str(v))
-                                    if hasattr(dt, 'status_tree_03') and dt.status_tree_03.exists(iid):
-                                        dt.status_tree_03.set(iid, 'value', str(v))
-                                except Exception:
-                                    pass
-                            self.root.after(0, _upd)
-                        self.append_log(f"Drive {did} Status {addr}: OK -> {v}")
-                    else:
-                        # legacy numeric parameter id
-                        pid = str(fav)
-                        try:
-                            addr = int(pid)
-                        except Exception:
-                            err = f"Drive {did} Param {pid}: invalid id"
-                            errors.append(err)
-                            self.append_log(err)
-                            continue
-                        try:
-                            vals = self.transport.read_status(did, addr, 1, func=0x03)
-                        except Exception as ex:
-                            err = f"Drive {did} Param {pid}: {ex}"
-                            errors.append(err)
-                            self.append_log(err)
-                            continue
-                        if not vals:
-                            err = f"Drive {did} Param {pid}: no response"
-                            errors.append(err)
-                            self.append_log(err)
+            did = int(did_str)
+            for fav in plist:
+                parsed = _parse_fav(fav)
+                if parsed is None:
+                    fail(f"Drive {did} Status {fav}: malformed key")
+                    continue
+                if parsed[0] == 's':
+                    _, func, addr = parsed
+                    item = (f"Drive {did} Status {addr}", None, f's:{func:02d}:{addr}')
+                else:
+                    # 'p:<id>' or a legacy numeric parameter id
+                    pid = parsed[1]
+                    try:
+                        addr = int(pid)
+                    except Exception:
+                        fail(f"Drive {did} Param {pid}: invalid id")
+                        continue
+                    func = 0x03
+                    item = (f"Drive {did} Param {pid}", pid, None)
+                wanted.setdefault((did, func), {}).setdefault(addr, []).append(item)
+
+        read_status = self.transport.read_status
+        now = time.monotonic()
+        # drives that did not answer (or are resting) in this sweep; the rest of
+        # their favorites fail without waiting out the timeout again
+        silent = set()
+        answered = set()
+        try:
+            for (did, func), by_addr in wanted.items():
+                if did not in silent and self._drive_retry_at.get(did, 0.0) > now:
+                    silent.add(did)
+                if did in silent:
+                    fail(f"Drive {did}: {sum(map(len, by_addr.values()))} favorites skipped, drive not responding")
+                    continue
+                # UI is updated only if the drive tab is open
+                dt = self.drive_tabs.get(did)
+                # (pid or None, status iid or None, value) for the whole group
+                updates = []
+                for start, count in _status_runs(by_addr, max_count=READ_ALL_MAX_REGS, max_gap=FAV_READ_MAX_GAP):
+                    if did in silent:
+                        for addr in range(start, start + count):
+                            for label, _, _ in by_addr.get(addr, ()):
+                                fail(f"{label}: drive not responding")
+                        continue
+                    try:
+                        block = read_status(did, start, count, func=func)
+                    except TimeoutError as exc:
+                        # no answer at all: single reads would just time out one by one
+                        silent.add(did)
+                        for addr in range(start, start + count):
+                            for label, _, _ in by_addr.get(addr, ()):
+                                fail(f"{label}: {exc}")
+                        continue
+                    except Exception:
+                        # one bad register fails the whole request; retry singly so
+                        # errors are reported per favorite
+                        block = None
+                    for addr in range(start, start + count):
+                        items = by_addr.get(addr)
+                        if not items:
+                            # a gap register read only to join the run
                             continue
-                        v = vals[0]
-                        dt = self.drive_tabs.get(did)
-                        if dt:
+                        if block is not None:
+                            v = block[addr - start]
+                        else:
                             try:
-                                w = dt.param_widgets.get(str(pid))
-                                if w:
-                                    entry = w.get('entry') if isinstance(w, dict) else w[0]
-                                    self.root.after(0, lambda e=entry, vv=v: (e.delete(0, 'end'), e.insert(0, str(vv))))
-                            except Exception:
-                                pass
-                        self.append_log(f"Drive {did} Param {pid}: OK -> {v}")
-                except Exception as exc:
-                    err = f"Drive {did} fav {fav}: {exc}"
-                    errors.append(err)
-                    self.append_log(err)
+                                v = read_status(did, addr, 1, func=func)[0]
+                            except Exception as ex:
+                                for label, _, _ in items:
+                                    fail(f"{label}: {ex}")
+                                continue
+                        answered.add(did)
+                        for label, pid, iid in items:
+                            if dt:
+                                updates.append((pid, iid, v))
+                            lines.append(f"{label}: OK -> {v}")
+                flush(dt, updates)
+        finally:
+            # parse errors and anything logged before an unexpected error
+            flush()
+        for did in silent.difference(answered):
+            self._drive_timed_out(did, now)
+        for did in answered:
+            self._drive_answered(did)
         return errors
 
+    def _drive_timed_out(self, did, now):
+        # a sweep got no answer from drive `did`; after DRIVE_FAIL_LIMIT such sweeps
+        # in a row it is only probed every DRIVE_RETRY_SECONDS (I/O thread only)
+        if self._drive_retry_at.get(did, 0.0) > now:
+            # skipped while resting, not a new failure
+            return
+        fails = self._drive_fails[did] = self._drive_fails.get(did, 0) + 1
+        if fails >= DRIVE_FAIL_LIMIT:
+            self._drive_retry_at[did] = now + DRIVE_RETRY_SECONDS
+            if fails == DRIVE_FAIL_LIMIT:
+                self.root.after(0, self.append_log, f"Drive {did}: no answer in {fails} sweeps; retrying every {DRIVE_RETRY_SECONDS:g}s")
+
+    def _drive_answered(self, did):
+        if self._drive_fails.pop(did, 0) >= DRIVE_FAIL_LIMIT:
+            self._drive_retry_at.pop(did, None)
+            self.root.after(0, self.append_log, f"Drive {did}: answering again")
+
+    def _apply_fav_reads(self, dt, updates, lines):
+        """Show one (drive, function) group of favorite values and log them; Tk thread only."""
+        set_param_value = dt.set_param_value if updates else None
+        apply_status_value = dt._apply_status_value if updates else None
+        for pid, iid, v in updates:
+            if pid is not None:
+                set_param_value(pid, v)
+            else:
+                apply_status_value(iid, str(v))
+        self.append_log_lines(lines)
+
     def _toggle_autoread(self):
         try:
-            if getattr(self, '_auto_read_job', None):
+            if self._auto_read_job:
                 # stop autoread
                 try:
                     self.root.after_cancel(self._auto_read_job)
                 except Exception:
                     pass
                 self._auto_read_job = None
+                # a sweep already queued or running must not schedule another one
+                self._auto_read_gen += 1
                 self.autoread_btn.config(text='Auto-Read: Off')
                 self.append_log('Auto-Read stopped by user')
                 return
@@ -2076,22 +2079,34 @@ class App:
             # reset failure tracking
             self._auto_read_failures = 0
             self._auto_read_backoff = 0
+            # only the newest start/stop may keep the chain of sweeps going
+            self._auto_read_gen += 1
+            gen = self._auto_read_gen
 
             def run_once_and_schedule():
-                # runs in a background thread and schedules the next run from main thread
+                # runs in a background thread and schedules the next run from main thread;
+                # the next sweep is only scheduled once this one is done, so sweeps
+                # never pile up even when they take longer than the interval
+                if gen != self._auto_read_gen:
+                    return
                 try:
                     errors = self._do_read_all_favorites(log_summary=False)
                 except Exception as e:
                     errors = [str(e)]
                 def after_cb():
+                    if gen != self._auto_read_gen:
+                        # stopped (or restarted) while this sweep was running
+                        return
                     # update failure/backoff counters
                     if errors:
-                        self._auto_read_failures = getattr(self, '_auto_read_failures', 0) + 1
+                        self._auto_read_failures += 1
                         # after 3 consecutive failures increase backoff (exponential, capped)
                         if self._auto_read_failures >= 3:
-                            self._auto_read_backoff = min(getattr(self, '_auto_read_backoff', 0) + 1, 5)
-                            next_interval = interval * (2 ** self._auto_read_backoff)
-                            self.append_log(f"Auto-Read: {len(errors)} errors; backing off to {next_interval}s (failures={self._auto_read_failures})")
+                            self._auto_read_backoff = min(self._auto_read_backoff + 1, 5)
+                            # jittered between the normal interval and the backoff ceiling,
+                            # so retries against a misbehaving bus don't fall into lockstep
+                            next_interval = random.uniform(interval, interval * (2 ** self._auto_read_backoff))
+                            self.append_log(f"Auto-Read: {len(errors)} errors; backing off to {next_interval:.1f}s (failures={self._auto_read_failures})")
                         else:
                             next_interval = interval
                             self.append_log(f"Auto-Read: {len(errors)} errors (failure count={self._auto_read_failures})")
@@ -2102,10 +2117,8 @@ class App:
                         next_interval = interval
                     # schedule next run
                     try:
-                        # create a new thread for the next run
-                        def schedule_thread():
-                            threading.Thread(target=run_once_and_schedule, daemon=True).start()
-                        self._auto_read_job = self.root.after(int(next_interval * 1000), schedule_thread)
+                        # queue the next run on the serial worker
+                        self._auto_read_job = self.root.after(int(next_interval * 1000), self.submit_io, run_once_and_schedule)
                     except Exception:
                         self._auto_read_job = None
                 # call after_cb on main thread
@@ -2114,7 +2127,7 @@ class App:
                 except Exception:
                     pass
 
-            # start first run in a thread
-            threading.Thread(target=run_once_and_schedule, daemon=True).start()
+            # start first run on the serial worker
+            self.submit_io(run_once_and_schedule)
         except Exception:
             pass
@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from transport import SerialTransport, compute_crc
+
+
+class FakeSerial:
+    """Answers every request with a canned reply; read() waits out `timeout` when short, like pyserial."""
+
+    def __init__(self, reply, timeout=1.0):
+        self.reply = reply
+        self.timeout = timeout
+        self.is_open = True
+        self.buf = b''
+
+    def reset_input_buffer(self):
+        self.buf = b''
+
+    def write(self, data):
+        self.buf += self.reply
+        return len(data)
+
+    def read(self, n):
+        data, self.buf = self.buf[:n], self.buf[n:]
+        if len(data) < n:
+            time.sleep(self.timeout)
+        return data
+
+
+def frame(payload):
+    return payload + compute_crc(payload).to_bytes(2, 'little')
+
+
+# 0x06 write: the echo is the request itself and must not wait for a missing byte
+req = frame(bytes([1, 0x06, 0x00, 0x10, 0x00, 0x2A]))
+t = SerialTransport()
+t.ser = FakeSerial(req)
+t0 = time.monotonic()
+resp = t.send_and_receive(req)
+assert resp == req, resp
+assert time.monotonic() - t0 < 0.5, 'write echo waited for the read timeout'
+
+# 0x03 read of two registers
+reply = frame(bytes([1, 0x03, 4, 0x00, 0x07, 0x01, 0x00]))
+t.ser = FakeSerial(reply)
+t0 = time.monotonic()
+assert t.read_status(1, 0x10, 2, func=0x03) == [7, 256]
+assert time.monotonic() - t0 < 0.5, 'register read waited for the read timeout'
+
+# exception reply
+t.ser = FakeSerial(frame(bytes([1, 0x84, 0x02])))
+try:
+    t.read_status(1, 0x10, 1)
+except IOError as e:
+    assert 'exception 0x02' in str(e), e
+else:
+    raise AssertionError('exception reply not raised')
+
+print('Transport framing OK')
@@ -1,8 +1,17 @@
 import threading
 import time
+import struct
+from functools import lru_cache
 import serial
 from datetime import datetime
 
+try:
+    # Optional: crcmod computes the same CRC in C when its extension is built
+    from crcmod.crcmod import _usingExtension as _CRCMOD_HAS_EXT
+    from crcmod.predefined import mkPredefinedCrcFun
+except ImportError:
+    _CRCMOD_HAS_EXT = False
+
 # Transport constants
 # Bits per character on the serial line (start + data + parity + stop)
 BITS_PER_CHAR = 10
@@ -12,18 +21,58 @@ START_CHARS = 200
 MIN_START_TIMEOUT = 0.5
 
 
-def compute_crc(data: bytes) -> int:
-    # Follow Modbus RTU CRC algorithm exactly, masking to 16 bits as we go.
-    crc = 0xFFFF
-    for a in data:
-        crc ^= (a & 0xFF)
+def _build_crc_table():
+    # Precompute the Modbus RTU CRC-16 (reflected poly 0xA001) for every byte value,
+    # so compute_crc needs one lookup per byte instead of 8 shift/XOR steps.
+    table = []
+    for a in range(256):
+        crc = a
         for _ in range(8):
-            lsb = crc & 0x0001
-            crc >>= 1
-            if lsb:
-                crc ^= 0xA001
-            crc &= 0xFFFF
-    return crc & 0xFFFF
+            # branchless: -(crc & 1) is all ones when the LSB is set, else zero
+            crc = (crc >> 1) ^ (0xA001 & -(crc & 0x0001))
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC_TABLE = _build_crc_table()
+
+
+def compute_crc(data: bytes, crc: int = 0xFFFF) -> int:
+    # Modbus RTU CRC-16, table-driven; the result always fits in 16 bits.
+    # Pass a previous result as `crc` to continue over further bytes, i.e.
+    # compute_crc(b, compute_crc(a)) == compute_crc(a + b).
+    for a in data:
+        crc = (crc >> 8) ^ _CRC_TABLE[(crc ^ a) & 0xFF]
+    return crc
+
+
+if _CRCMOD_HAS_EXT:
+    # crcmod's pure-Python fallback is no faster than the table above, so only
+    # switch when the C extension is available
+    compute_crc = mkPredefinedCrcFun('modbus')
+
+
+_READ_REQ_STRUCT = struct.Struct('>BBHH')
+
+
+@lru_cache(maxsize=256)
+def read_request(drive_id: int, func: int, start_addr: int, count: int) -> bytes:
+    # Addr(1) FC(1) START_H START_L NUM_H NUM_L CRC_L CRC_H
+    # status refreshes send the same few frames every time, so build each one once
+    req = _READ_REQ_STRUCT.pack(drive_id, func, start_addr, count)
+    return req + struct.pack('<H', compute_crc(req))
+
+
+# precompiled decoders for `count` big-endian 16-bit registers, keyed by count
+_REGS_STRUCTS = {}
+
+
+def unpack_registers(data, offset: int, count: int) -> tuple:
+    # decode `count` registers from `data` at `offset` in one C call
+    st = _REGS_STRUCTS.get(count)
+    if st is None:
+        st = _REGS_STRUCTS[count] = struct.Struct(f'>{count}H')
+    return st.unpack_from(data, offset)
 
 
 class SerialTransport:
@@ -31,12 +80,15 @@ class SerialTransport:
         self.ser = None
         self.lock = threading.Lock()
         self.debug = bool(debug)
+        # True when the input buffer may hold bytes that belong to no pending reply
+        self._rx_dirty = True
 
     def enable_debug(self, enabled: bool = True):
         self.debug = bool(enabled)
 
     def _fmt_bytes(self, data: bytes) -> str:
-        return ' '.join(f"{b:02X}" for b in data)
+        # single C-level call instead of one f-string per byte
+        return bytes(data).hex(' ').upper()
 
     def _log_hex(self, direction: str, data: bytes):
         ts = datetime.now().strftime("%H:%M:%S.%f")
@@ -46,7 +98,18 @@ class SerialTransport:
         if self.ser and self.ser.is_open:
             self.close()
         p = {'N': serial.PARITY_NONE, 'E': serial.PARITY_EVEN, 'O': serial.PARITY_ODD}[parity]
-        self.ser = serial.Serial(port=port, baudrate=baudrate, bytesize=8, parity=p, stopbits=1, timeout=0)
+        # blocking reads: the driver wakes us as soon as the bytes are there, and the
+        # read timeout doubles as the wait-for-first-byte timeout
+        self.ser = serial.Serial(port=port, baudrate=baudrate, bytesize=8, parity=p, stopbits=1,
+                                 timeout=self._start_timeout(baudrate))
+        self._rx_dirty = True
+
+    @staticmethod
+    def _start_timeout(baudrate):
+        # Wait-for-first-byte timeout: use formula 1/baud * START_CHARS * BITS_PER_CHAR
+        calc = (1.0 / float(baudrate)) * float(START_CHARS) * float(BITS_PER_CHAR)
+        # enforce a sensible minimum timeout to avoid overly short waits at high baudrates
+        return max(calc, MIN_START_TIMEOUT)
 
     def close(self):
         if self.ser:
@@ -69,12 +132,14 @@ class SerialTransport:
             raise IOError('Serial port not open')
 
         with self.lock:
-            try:
+            # only flush the input buffer when something may have been left in it;
+            # after a complete reply it is empty and the flush is a wasted syscall
+            if self._rx_dirty:
                 self.ser.reset_input_buffer()
-            except Exception:
-                pass
+                self._rx_dirty = False
+            # no flush(): tcdrain() waits out a whole tick on many USB adapters, and
+            # the reply cannot start before the request has left anyway
             self.ser.write(request)
-            self.ser.flush()
             if self.debug:
                 try:
                     self._log_hex('COM ->', request)
@@ -82,105 +147,121 @@ class SerialTransport:
                     pass
 
             if not expect_response:
+                # the drive may still answer; drop that before the next request
+                self._rx_dirty = True
                 return b''
 
-            # Wait-for-first-byte timeout: use formula 1/baud * START_CHARS * BITS_PER_CHAR
-            calc = (1.0 / float(self.ser.baudrate)) * float(START_CHARS) * float(BITS_PER_CHAR)
-            # enforce a sensible minimum timeout to avoid overly short waits at high baudrates
-            start_timeout = max(calc, MIN_START_TIMEOUT)
-            start = time.time()
-            first = b''
+            try:
+                return self._receive()
+            except Exception:
+                # a late, partial or corrupt reply may still be on its way in
+                self._rx_dirty = True
+                raise
+
+    def _receive(self):
+        # read one reply frame; caller holds self.lock
+        # Addr FC and byte count / register high byte in one call; blocks for at most
+        # the port's read timeout (_start_timeout, set in open)
+        header = self.ser.read(3)
+        if not header:
+            raise TimeoutError('No response started within timeout')
+        if len(header) < 3:
+            header += self._read_exact(3 - len(header))
+        if len(header) < 3:
+            raise IOError('Incomplete header')
+        cmd = header[1]
+        if cmd == 0x03:
+            byte_num = header[2]
+            data = self._read_exact(byte_num + 2)
+            resp = header + data
+            if self.debug:
+                try:
+                    self._log_hex('COM <-', resp)
+                except Exception:
+                    pass
+            if not self._check_crc(resp):
+                raise IOError('CRC mismatch')
+            return resp
+        elif cmd == 0x04:
+            # function 0x04 (read input registers) has same structure as 0x03
+            byte_num = header[2]
+            data = self._read_exact(byte_num + 2)
+            resp = header + data
+            if self.debug:
+                try:
+                    self._log_hex('COM <-', resp)
+                except Exception:
+                    pass
+            if not self._check_crc(resp):
+                raise IOError('CRC mismatch')
+            return resp
+        elif cmd == 0x06:
+            # echo: Addr FC ADDR_H ADDR_L VAL_H VAL_L CRC_L CRC_H, 5 bytes after the header
+            rest = self._read_exact(5)
+            resp = header + rest
+            if self.debug:
+                try:
+                    self._log_hex('COM <-', resp)
+                except Exception:
+                    pass
+            if not self._check_crc(resp):
+                raise IOError('CRC mismatch')
+            return resp
+        elif cmd & 0x80:
+            # exception response: Addr FC|0x80 CODE CRC_L CRC_H, so only the CRC
+            # is left; no need to wait for the line to go idle
+            resp = header + self._read_exact(2)
+            if self.debug:
+                try:
+                    self._log_hex('COM <-', resp)
+                except Exception:
+                    pass
+            if not self._check_crc(resp):
+                raise IOError('CRC mismatch')
+            return resp
+        else:
+            # unknown length: collect until the line has been idle for 50 ms
+            buf = b''
+            t0 = time.monotonic()
             while True:
-                if time.time() - start > start_timeout:
-                    raise TimeoutError('No response started within timeout')
-                b = self.ser.read(1)
-                if b:
-                    first = b
-                    break
-                time.sleep(0.001)
-
-            header = first + self._read_exact(2)
-            if len(header) < 3:
-                raise IOError('Incomplete header')
-            cmd = header[1]
-            if cmd == 0x03:
-                byte_num = header[2]
-                data = self._read_exact(byte_num + 2)
-                resp = header + data
-                if self.debug:
-                    try:
-                        self._log_hex('COM <-', resp)
-                    except Exception:
-                        pass
-                if not self._check_crc(resp):
-                    raise IOError('CRC mismatch')
-                return resp
-            elif cmd == 0x04:
-                # function 0x04 (read input registers) has same structure as 0x03
-                byte_num = header[2]
-                data = self._read_exact(byte_num + 2)
-                resp = header + data
-                if self.debug:
-                    try:
-                        self._log_hex('COM <-', resp)
-                    except Exception:
-                        pass
-                if not self._check_crc(resp):
-                    raise IOError('CRC mismatch')
-                return resp
-            elif cmd == 0x06:
-                rest = self._read_exact(4 + 2)
-                resp = header + rest
-                if self.debug:
-                    try:
-                        self._log_hex('COM <-', resp)
-                    except Exception:
-                        pass
-                if not self._check_crc(resp):
-                    raise IOError('CRC mismatch')
+                waiting = self.ser.in_waiting
+                if waiting:
+                    buf += self.ser.read(waiting)
+                    t0 = time.monotonic()
+                else:
+                    if time.monotonic() - t0 > 0.05:
+                        break
+                    time.sleep(0.001)
+            resp = header + buf
+            if self.debug:
+                try:
+                    self._log_hex('COM <-', resp)
+                except Exception:
+                    pass
+            if len(resp) >= 3 and self._check_crc(resp):
                 return resp
             else:
-                buf = b''
-                t0 = time.time()
-                while True:
-                    chunk = self.ser.read(256)
-                    if chunk:
-                        buf += chunk
-                        t0 = time.time()
-                    else:
-                        if time.time() - t0 > 0.05:
-                            break
-                        time.sleep(0.001)
-                resp = header + buf
-                if self.debug:
-                    try:
-                        self._log_hex('COM <-', resp)
-                    except Exception:
-                        pass
-                if len(resp) >= 3 and self._check_crc(resp):
-                    return resp
-                else:
-                    raise IOError('Unknown or invalid response')
+                raise IOError('Unknown or invalid response')
 
     def _read_exact(self, n, timeout=1.0):
+        # each read blocks until the missing bytes arrive or the port timeout
+        # passes; usually the first call returns them all
         data = b''
-        start = time.time()
+        deadline = time.monotonic() + timeout
         while len(data) < n:
             chunk = self.ser.read(n - len(data))
             if chunk:
                 data += chunk
-            else:
-                if time.time() - start > timeout:
-                    break
-                time.sleep(0.001)
+            elif time.monotonic() > deadline:
+                break
         return data
 
     def _check_crc(self, data: bytes) -> bool:
         if len(data) < 3:
             return False
-        crc_recv = data[-2] | (data[-1] << 8)
-        calc = compute_crc(data[:-2])
-        return crc_recv == calc
+        # running the CRC over the payload plus its appended CRC (low, high) leaves
+        # a zero residue, so the frame need not be sliced into a new bytes object
+        return compute_crc(data) == 0
 
     def read_status(self, drive_id: int, start_addr: int, count: int = 1, func: int = 0x04):
         """Read `count` 16-bit status registers starting at `start_addr` using function `func` (0x04 or 0x03).
@@ -190,23 +271,16 @@ class SerialTransport:
         """
         if func not in (0x03, 0x04):
             raise ValueError('Unsupported function for status read')
-        # build request: Addr(1) FC(1) START_H START_L NUM_H NUM_L CRC_L CRC_H
         try:
-            import struct as _struct
-            req = _struct.pack('>B B H H', drive_id, func, start_addr, count)
-            crc = compute_crc(req)
-            req += _struct.pack('<H', crc)
-            resp = self.send_and_receive(req)
+            resp = self.send_and_receive(read_request(drive_id, func, start_addr, count))
             # resp[2] = byte count, then two-byte values
             if len(resp) < 3:
                 raise IOError('Short response')
-            byte_num = resp[2]
-            data = resp[3:3+byte_num]
-            vals = []
-            for i in range(0, len(data), 2):
-                hi = data[i]
-                lo = data[i+1] if i+1 < len(data) else 0
-                vals.append((hi << 8) | lo)
+            if resp[1] & 0x80:
+                raise IOError(f'Modbus exception {resp[2]:#04x}')
+            # registers actually present between the byte count and the CRC
+            n = min(resp[2], len(resp) - 5) // 2
+            vals = list(unpack_registers(resp, 3, n))
             # ensure list length matches requested count (pad with zeros if missing)
             while len(vals) < count:
                 vals.append(0)